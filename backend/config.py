@@ -305,6 +305,8 @@ class PlanHubConfig(ScraperConfig):
     FILTER_ID = 99806          # "Daniel's Filter"
     SUB_TRADES = [135]         # Fire Alarm trade ID
     TOKEN_FILE = os.path.join(os.path.dirname(__file__), 'planhub_token.json')
+    TOKEN_TRUST_MINUTES = 30  # reuse a recently saved/validated token without re-validating
+    CACHE_FILE = os.path.join(os.path.dirname(__file__), 'planhub_cache.sqlite3')  # per-project lead cache
 
     # Credentials
     LOGIN_EMAIL = os.getenv("PLANHUB_LOGIN") or os.getenv("SITE_LOGIN", "")
@@ -318,6 +320,29 @@ class PlanHubConfig(ScraperConfig):
 
     # Scraping Limits
     MAX_PROJECTS_DEFAULT = None  # None = all projects (no enrichment API calls needed)
+    # Ask the API to drop past-due projects (bid_due_date_range.from = today).
+    # Off by default until the filter schema is confirmed against a debug dump;
+    # the list is sorted by due date either way, so paging stops at the first
+    # fully past-due page.
+    FILTER_ACTIVE_ONLY = os.getenv('PLANHUB_FILTER_ACTIVE_ONLY', 'false').lower() in ('true', '1', 'yes')
+
+    # HTTP client limits (one pooled client is shared by every API call)
+    MAX_CONNECTIONS = 64
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    KEEPALIVE_EXPIRY = 60  # seconds an idle pooled connection is kept
+    HTTP_TIMEOUT = 30  # seconds
+    HTTP_CONNECT_TIMEOUT = 10  # seconds
+    MAX_CONCURRENT_REQUESTS = 32  # in-flight API requests
+    API_RATE_LIMIT = 10  # requests/second per host (halved on 429)
+    API_RATE_BURST = 2  # requests that may start back-to-back after an idle spell
+    MAX_CONCURRENT_DOWNLOADS = 8
+    MAX_CONCURRENT_GDRIVE_CALLS = 8  # Drive lookups run in worker threads
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+    # Project list pipeline (pages feed a bounded queue drained by workers)
+    PROJECT_QUEUE_SIZE = 256
+    SCRAPE_WORKERS = 4
+    PAGE_PREFETCH = 4  # project-list pages requested concurrently
 
     # Sprinkler Keywords
     SPRINKLER_KEYWORDS = [
@@ -380,6 +405,11 @@ class PlanHubConfig(ScraperConfig):
     # Select All Files checkbox
     SELECT_ALL_FILES_CHECKBOX = '#mat-checkbox-1 > label > span.mat-checkbox-inner-container.mat-checkbox-inner-container-no-side-margin'
 
+    # Browser tabs the DOM scraper's Pass 2 (details + downloads) runs at once
+    DOM_DOWNLOAD_TABS = 3
+    # ms the DOM scraper waits for a clicked Download to start
+    DOWNLOAD_START_TIMEOUT = 60000
+
     # Download Files button (full path)
     DOWNLOAD_FILES_BTN = 'body > planhub-main > div > mat-sidenav-container > mat-sidenav-content > app-root > div > app-project-details > div > app-project-details-v2 > div > div > div.tabs-container > div.project-files.ng-star-inserted > mat-card > planhub-project-file-table > div > div.table-pagination.flex-row.align-space-between.pd-0 > planhub-button > button'
 
@@ -9,15 +9,52 @@ is launched *once* to log in and intercept a fresh token, then the browser
 is closed immediately.
 """
 import os
+import re
 import sys
 import json
+import time
+import hashlib
+import random
+import shutil
 import asyncio
+import logging
+import functools
+import sqlite3
+import tempfile
 import platform
-import traceback
-from datetime import datetime, date
+from collections import deque
+from contextlib import closing
+from datetime import datetime, date, timedelta
 
 import httpx
 
+# orjson parses API responses several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ciso8601 is a C ISO-8601 parser; fromisoformat is the stdlib fallback
+try:
+    import ciso8601
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:
+    def _parse_iso(text):
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+# Aho-Corasick matches every sprinkler keyword in one pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# HTTP/2 lets concurrent API calls share one connection; needs the h2 extra
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -26,8 +63,7 @@ from config import PlanHubConfig, DATE_FORMATS
 # Import Google Drive service
 try:
     from services.google_drive import (
-        upload_and_cleanup, should_use_gdrive, is_authenticated,
-        get_status, check_file_exists,
+        upload_and_cleanup, should_use_gdrive, check_file_exists,
     )
     GDRIVE_AVAILABLE = True
 except ImportError:
@@ -36,22 +72,50 @@ except ImportError:
 # ---------------------------------------------------------------------------
 # Logging (same interface the scheduler expects)
 # ---------------------------------------------------------------------------
-_ph_log_buffer = []
+logger = logging.getLogger(__name__)
+
+# Bounded so a run with nobody draining it can't grow without limit
+_ph_log_buffer = deque(maxlen=1000)
+_LOG_FLUSH_INTERVAL = 0.1
+_last_log_flush = 0.0
 
 
 def get_ph_logs():
     """Get and clear the log buffer."""
-    global _ph_log_buffer
-    logs = _ph_log_buffer.copy()
-    _ph_log_buffer = []
+    logs = []
+    try:
+        while True:
+            logs.append(_ph_log_buffer.popleft())
+    except IndexError:
+        pass
     return logs
 
 
 def log_status(msg):
-    """Log to console and buffer (scheduler collector forwards to web UI)."""
-    global _ph_log_buffer
-    print(f"[PH] {msg}", flush=True)
-    _ph_log_buffer.append(f"[PH] {msg}")
+    """Log to console and buffer (scheduler collector forwards to web UI).
+
+    When logging is configured (the API server), the console line goes
+    through the module logger so it is formatted and filtered like the
+    rest of the app's output.  Standalone runs write to stdout directly,
+    flushed at most every _LOG_FLUSH_INTERVAL seconds rather than per
+    line; call flush_logs() at the end of a run.
+    """
+    global _last_log_flush
+    line = f"[PH] {msg}"
+    _ph_log_buffer.append(line)
+    if logger.hasHandlers():
+        logger.info("%s", msg)
+        return
+    sys.stdout.write(line + "\n")
+    now = time.monotonic()
+    if now - _last_log_flush >= _LOG_FLUSH_INTERVAL:
+        _last_log_flush = now
+        sys.stdout.flush()
+
+
+def flush_logs():
+    """Push any console output still sitting in the stdout buffer."""
+    sys.stdout.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -61,7 +125,11 @@ PLANHUB_DEBUG = os.getenv("PLANHUB_DEBUG", "").lower() in ("1", "true", "yes")
 
 
 def _debug_dump(label, data):
-    """When PLANHUB_DEBUG is set, write API response to disk."""
+    """When PLANHUB_DEBUG is set, write API response to disk.
+
+    Call sites also check PLANHUB_DEBUG so the label f-string isn't built
+    for every response when debugging is off.
+    """
     if not PLANHUB_DEBUG:
         return
     debug_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "downloads")
@@ -69,57 +137,457 @@ def _debug_dump(label, data):
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = os.path.join(debug_dir, f"api_debug_{label}_{ts}.json")
     try:
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(path, "wb") as f:
+            f.write(_json_dumps_pretty(data))
         log_status(f"DEBUG: saved {label} -> {path}")
     except Exception as e:
         log_status(f"DEBUG: could not save {label}: {e}")
 
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+
+# File extensions accepted as-is for captured download URLs; anything else
+# gets ".pdf" appended.
+_KNOWN_FILE_EXTS = frozenset({"pdf", "zip", "dwg", "dwf", "doc", "docx", "xls", "xlsx"})
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+class _TokenBucket:
+    """Async token bucket allowing *rate* acquisitions per second.
+
+    At most *burst* tokens accumulate while idle (default: one second's
+    worth), so a small burst spaces requests out evenly instead of firing
+    them all at once.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst) if burst else self.rate
+        self._tokens = min(self.rate, self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate, self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def slow_down(self):
+        """Halve the rate after the server pushes back (floor 1 req/s)."""
+        self.rate = max(1.0, self.rate / 2)
+        self._tokens = min(self._tokens, self.rate)
+
+
+def _write_atomic(path, data):
+    """Replace *path* with *data* via a temp file and os.replace().
+
+    A crash mid-write leaves the old file intact instead of a truncated
+    one; a failed write removes the temp file before re-raising.  Returns
+    the stat of the written file.
+    """
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(data)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return st
+
+
+async def _stream_to_file(response, dest, chunk_size):
+    """Write a streamed httpx response to *dest*, keeping disk writes off the event loop.
+
+    If the stream fails or is cancelled, the partial file is removed so a
+    preallocated, zero-filled body is never mistaken for a finished download.
+    """
+    try:
+        with open(dest, "wb") as f:
+            _preallocate(f, response)
+            async for chunk in response.aiter_bytes(chunk_size):
+                await asyncio.to_thread(f.write, chunk)
+            # Drop any preallocated tail if the body came up short
+            f.truncate()
+    except BaseException:
+        try:
+            os.remove(dest)
+        except OSError:
+            pass
+        raise
+
+
+def _preallocate(f, response):
+    """Reserve disk space for the whole file up front when its size is known.
+
+    Plan sets run to hundreds of MB; allocating them in one go avoids a
+    fragmented file on the Pi's SD card.  Skipped for compressed bodies,
+    where Content-Length is not the decoded size.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    if response.headers.get("content-encoding", "identity") != "identity":
+        return
+    try:
+        size = int(response.headers.get("content-length", 0))
+    except ValueError:
+        return
+    if size > 0:
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass  # not supported on this filesystem; write normally
+
+
+def _json_loads(data):
+    """Decode a JSON response body (bytes) with orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps_pretty(data):
+    """Indented JSON as bytes, with orjson when available; str() for odd types."""
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+        except TypeError:
+            pass  # e.g. non-str dict keys, which stdlib json coerces
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def _json_dumps_leads(leads):
+    """Serialize leads exactly as the rest of the app writes leads_db.json.
+
+    That is json.dump(..., indent=2), which escapes non-ASCII; other
+    readers open the file in the platform's default text encoding, so
+    orjson's raw UTF-8 output is only used when it is pure ASCII.
+    """
+    if orjson:
+        try:
+            out = orjson.dumps(leads, option=orjson.OPT_INDENT_2)
+            if out.isascii():
+                return out
+        except TypeError:
+            pass
+    return json.dumps(leads, indent=2).encode()
+
+
+def _backoff(attempt):
+    """Exponential backoff with jitter so retries don't stampede."""
+    return 2 ** attempt + random.uniform(0, 1)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(text):
+    """Parse a PlanHub date string to a date, or None.
+
+    The API almost always sends ISO timestamps, so that path goes first;
+    the DATE_FORMATS loop covers the rest.  Memoized because the same few
+    due dates repeat across a whole project list.
+    """
+    try:
+        return _parse_iso(text).date()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _keyword_matcher(keywords):
+    """Predicate: does lowercased text contain any of *keywords*?
+
+    Built once per keyword set and shared by every scraper instance: one
+    Aho-Corasick automaton when pyahocorasick is installed, otherwise one
+    precompiled regex alternation.  Either way it is a single scan.
+    """
+    words = [kw.lower() for kw in keywords if kw]
+    if not words:
+        # An empty alternation would match every text
+        return lambda text: False
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = re.compile("|".join(map(re.escape, words)))
+    return lambda text: pattern.search(text) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome():
+    """Find Chrome executable on the system (looked up once per process)."""
+    system = platform.system()
+    possible_paths = []
+
+    if system == "Windows":
+        possible_paths = [
+            r"C:\Users\dms03\Development\planroom-genius\backend\chrome-win\chrome.exe",
+            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+            os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
+        ]
+    elif system == "Darwin":
+        possible_paths = [
+            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        ]
+    elif system == "Linux":
+        possible_paths = [
+            "/usr/bin/chromium-browser",
+            "/usr/bin/chromium",
+            "/usr/bin/google-chrome",
+            "/usr/bin/google-chrome-stable",
+        ]
+
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Shared browser session
+# ---------------------------------------------------------------------------
+class _BrowserSession:
+    """Lazily launched persistent Chrome context, reused for the whole run.
+
+    Token refreshes and project file downloads both need a browser on
+    CHROME_USER_DATA_DIR, and that profile can only be opened by one Chrome
+    instance at a time, so they share this one instead of each cold
+    launching (and racing for the profile lock).
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self._pw = None
+        self._ctx = None
+        self._lock = asyncio.Lock()
+        # Pages opened for our own use (token capture), which download code
+        # must not mistake for popups from the project page
+        self.private_pages = set()
+
+    async def context(self):
+        """Return the shared context, launching Chrome on first use."""
+        async with self._lock:
+            if self._ctx is None:
+                from playwright.async_api import async_playwright
+
+                self._pw = await async_playwright().start()
+
+                # Clean up stale SingletonLock from previous crashes
+                lock_file = os.path.join(self.config.CHROME_USER_DATA_DIR, "SingletonLock")
+                if os.path.exists(lock_file):
+                    try:
+                        os.remove(lock_file)
+                        log_status("Removed stale SingletonLock file")
+                    except OSError:
+                        pass
+
+                try:
+                    self._ctx = await self._pw.chromium.launch_persistent_context(
+                        user_data_dir=self.config.CHROME_USER_DATA_DIR,
+                        headless=self.config.HEADLESS,
+                        args=[
+                            "--no-sandbox",
+                            "--disable-setuid-sandbox",
+                            "--disable-dev-shm-usage",
+                            "--disable-blink-features=AutomationControlled",
+                            "--disable-gpu",
+                            "--mute-audio",
+                        ],
+                        executable_path=_find_chrome(),
+                        viewport={"width": 1280, "height": 900},
+                        ignore_https_errors=True,
+                        accept_downloads=True,
+                    )
+                except Exception:
+                    await self._stop_playwright()
+                    raise
+            return self._ctx
+
+    async def main_page(self):
+        """The context's default tab (used for file downloads)."""
+        ctx = await self.context()
+        return ctx.pages[0] if ctx.pages else await ctx.new_page()
+
+    async def private_page(self):
+        """A separate tab that download popup handling will ignore."""
+        ctx = await self.context()
+        page = await ctx.new_page()
+        self.private_pages.add(page)
+        return page
+
+    async def close_private_page(self, page):
+        self.private_pages.discard(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        async with self._lock:
+            if self._ctx:
+                try:
+                    await self._ctx.close()
+                except Exception:
+                    pass
+                self._ctx = None
+            await self._stop_playwright()
+            self.private_pages.clear()
+
+    async def _stop_playwright(self):
+        if self._pw:
+            try:
+                await self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+
+
 # ---------------------------------------------------------------------------
 # PlanHubAPIClient
 # ---------------------------------------------------------------------------
 class PlanHubAPIClient:
     """Thin HTTP client for PlanHub's REST API."""
 
+    # (token, saved/validated at) shared by every client in this process,
+    # so back-to-back scheduler runs skip the disk read and validation
+    _token_memo: tuple[str, datetime] | None = None
+
+    # Static API headers; only "authorization" varies (see the _token setter)
+    _BASE_HEADERS = {
+        "accept": "application/json",
+        "content-type": "application/json",
+        "origin": "https://supplier.planhub.com",
+        "referer": "https://supplier.planhub.com/",
+        "user-agent": USER_AGENT,
+        "sec-ch-ua-platform": '"Windows"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "same-site",
+    }
+
     def __init__(self, config: PlanHubConfig):
         self.config = config
         self._token: str | None = None
         self._client: httpx.AsyncClient | None = None
+        self._plain_client: httpx.AsyncClient | None = None
+        self._sem: asyncio.Semaphore | None = None
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._auth_task: asyncio.Task | None = None
+        self._refresh_lock: asyncio.Lock | None = None
+        self.browser = _BrowserSession(config)
 
     # -- lifecycle -----------------------------------------------------------
 
     async def open(self):
-        self._client = httpx.AsyncClient(timeout=30, follow_redirects=True)
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                self.config.HTTP_TIMEOUT, connect=self.config.HTTP_CONNECT_TIMEOUT
+            ),
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            headers={"user-agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=self.config.MAX_CONNECTIONS,
+                max_keepalive_connections=self.config.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.config.KEEPALIVE_EXPIRY,
+            ),
+        )
+        # Caps in-flight requests so concurrent callers queue here instead
+        # of piling up on the connection pool.
+        self._sem = asyncio.Semaphore(self.config.MAX_CONCURRENT_REQUESTS)
+        self._download_sem = asyncio.Semaphore(self.config.MAX_CONCURRENT_DOWNLOADS)
+        self._refresh_lock = asyncio.Lock()
+        # Kick off token load/validation now so it overlaps with the
+        # caller's own startup work; wait_auth() collects the result.
+        self._auth_task = asyncio.create_task(self.ensure_auth())
+
+    def plain_client(self) -> httpx.AsyncClient:
+        """Headerless, cookieless client for pre-signed file URLs.
+
+        Created on first use and kept for the rest of the run, so repeated
+        fallback downloads reuse pooled connections instead of paying a
+        fresh TLS handshake each time.
+        """
+        if self._plain_client is None:
+            self._plain_client = httpx.AsyncClient(
+                timeout=60,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.config.MAX_CONCURRENT_DOWNLOADS,
+                    max_keepalive_connections=self.config.MAX_CONCURRENT_DOWNLOADS,
+                    keepalive_expiry=self.config.KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._plain_client
+
+    async def wait_auth(self) -> bool:
+        """Wait for the auth started by open(), starting it if needed."""
+        if self._auth_task is None:
+            self._auth_task = asyncio.create_task(self.ensure_auth())
+        return await self._auth_task
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        if self._auth_task and not self._auth_task.done():
+            self._auth_task.cancel()
+            try:
+                await self._auth_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._auth_task = None
+        await self.browser.close()
+        for client in (self._client, self._plain_client):
+            if client:
+                await client.aclose()
+        self._client = self._plain_client = None
 
     # -- auth headers --------------------------------------------------------
 
+    @property
+    def _token(self):
+        return self.__token
+
+    @_token.setter
+    def _token(self, token):
+        # Rebuild the request headers once per token change, not per request
+        self.__token = token
+        self._auth_headers = self._token_headers(token)
+
+    def _token_headers(self, token):
+        return {**self._BASE_HEADERS, "authorization": f"auth_token {token}"}
+
     def _headers(self):
-        return {
-            "authorization": f"auth_token {self._token}",
-            "accept": "application/json",
-            "content-type": "application/json",
-            "origin": "https://supplier.planhub.com",
-            "referer": "https://supplier.planhub.com/",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-site",
-        }
+        return self._auth_headers
 
     # -- token management ----------------------------------------------------
 
-    def _load_cached_token(self) -> str | None:
-        """Load token from disk cache or env var override."""
+    def _load_cached_token(self) -> tuple[str | None, datetime | None]:
+        """Load token from disk cache or env var override.
+
+        Returns ``(token, saved_at)``; saved_at is None when unknown.
+        """
         # Env var takes precedence
         if self.config.AUTH_TOKEN:
-            return self.config.AUTH_TOKEN
+            return self.config.AUTH_TOKEN, None
 
         if os.path.exists(self.config.TOKEN_FILE):
             try:
@@ -128,18 +596,38 @@ class PlanHubAPIClient:
                 token = data.get("token", "")
                 if token:
                     log_status("Loaded cached auth token from disk")
-                    return token
+                    try:
+                        saved_at = datetime.fromisoformat(data.get("saved_at", ""))
+                    except ValueError:
+                        saved_at = None
+                    return token, saved_at
             except Exception as e:
                 log_status(f"Could not read token file: {e}")
-        return None
+        return None, None
+
+    def _token_is_fresh(self, at) -> bool:
+        """True if a token saved/validated at *at* can be used unchecked."""
+        return at is not None and datetime.now() - at < timedelta(
+            minutes=self.config.TOKEN_TRUST_MINUTES
+        )
+
+    @classmethod
+    def _remember_token(cls, token, at):
+        cls._token_memo = (token, at)
 
     def _save_token(self, token: str):
+        # Write-then-rename so a crash mid-write can't leave a corrupt token
+        # file behind (which would force a browser login next run)
+        tmp = self.config.TOKEN_FILE + ".tmp"
+        saved_at = datetime.now()
+        self._remember_token(token, saved_at)
         try:
-            with open(self.config.TOKEN_FILE, "w") as f:
+            with open(tmp, "w") as f:
                 json.dump({
                     "token": token,
-                    "saved_at": datetime.now().isoformat(),
-                }, f, indent=2)
+                    "saved_at": saved_at.isoformat(),
+                }, f)
+            os.replace(tmp, self.config.TOKEN_FILE)
             log_status("Saved auth token to disk")
         except Exception as e:
             log_status(f"Could not save token file: {e}")
@@ -149,16 +637,7 @@ class PlanHubAPIClient:
         try:
             r = await self._client.get(
                 f"{self.config.API_BASE_URL}/get-user-filters",
-                headers={
-                    "authorization": f"auth_token {token}",
-                    "accept": "application/json",
-                    "content-type": "application/json",
-                    "origin": "https://supplier.planhub.com",
-                    "referer": "https://supplier.planhub.com/",
-                    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
-                    "sec-fetch-mode": "cors",
-                    "sec-fetch-site": "same-site",
-                },
+                headers=self._token_headers(token),
             )
             if r.status_code == 200:
                 log_status("Auth token validated OK")
@@ -171,9 +650,9 @@ class PlanHubAPIClient:
 
     async def _obtain_token_via_browser(self) -> str | None:
         """
-        Launch Playwright, log in at access.planhub.com, intercept the
-        auth_token header from any outgoing API request, then close the
-        browser immediately.
+        Open a tab in the shared browser session, log in at
+        access.planhub.com, intercept the auth_token header from any
+        outgoing API request, then close the tab.
         """
         log_status("Obtaining fresh auth token via browser login...")
 
@@ -184,41 +663,7 @@ class PlanHubAPIClient:
         captured_token = None
 
         try:
-            from playwright.async_api import async_playwright
-
-            pw = await async_playwright().start()
-
-            # Find Chrome
-            chrome_path = self._find_chrome_executable()
-
-            launch_args = [
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-gpu",
-                "--mute-audio",
-            ]
-
-            # Clean up stale SingletonLock from previous crashes
-            lock_file = os.path.join(self.config.CHROME_USER_DATA_DIR, "SingletonLock")
-            if os.path.exists(lock_file):
-                try:
-                    os.remove(lock_file)
-                    log_status("Removed stale SingletonLock file")
-                except OSError:
-                    pass
-
-            ctx = await pw.chromium.launch_persistent_context(
-                user_data_dir=self.config.CHROME_USER_DATA_DIR,
-                headless=self.config.HEADLESS,
-                args=launch_args,
-                executable_path=chrome_path,
-                viewport={"width": 1280, "height": 720},
-                ignore_https_errors=True,
-            )
-
-            page = ctx.pages[0] if ctx.pages else await ctx.new_page()
+            page = await self.browser.private_page()
 
             # Intercept outgoing requests to capture the auth token
             def _on_request(request):
@@ -271,15 +716,9 @@ class PlanHubAPIClient:
                 except Exception as e:
                     log_status(f"Login form interaction failed: {e}")
 
-            # Close browser
-            try:
-                await ctx.close()
-            except Exception:
-                pass
-            try:
-                await pw.stop()
-            except Exception:
-                pass
+            # Done with the tab; the browser stays up for the rest of the run
+            page.remove_listener("request", _on_request)
+            await self.browser.close_private_page(page)
 
             if captured_token:
                 log_status("Successfully obtained auth token")
@@ -290,46 +729,31 @@ class PlanHubAPIClient:
 
         except Exception as e:
             log_status(f"Browser token capture failed: {e}")
-            traceback.print_exc()
+            logger.exception("Browser token capture failed")
             return None
 
-    def _find_chrome_executable(self):
-        """Find Chrome executable on the system."""
-        system = platform.system()
-        possible_paths = []
-
-        if system == "Windows":
-            possible_paths = [
-                r"C:\Users\dms03\Development\planroom-genius\backend\chrome-win\chrome.exe",
-                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
-            ]
-        elif system == "Darwin":
-            possible_paths = [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            ]
-        elif system == "Linux":
-            possible_paths = [
-                "/usr/bin/chromium-browser",
-                "/usr/bin/chromium",
-                "/usr/bin/google-chrome",
-                "/usr/bin/google-chrome-stable",
-            ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return None
-
     async def ensure_auth(self) -> bool:
         """
         Make sure we have a valid auth token.
         Tries cached token first, then falls back to browser login.
         """
+        # A token this process saved or validated recently is used as-is:
+        # if it has expired after all, _request's 401 handling refreshes it
+        memo = PlanHubAPIClient._token_memo
+        if memo and self._token_is_fresh(memo[1]):
+            self._token = memo[0]
+            return True
+
         # Try cached / env token
-        token = self._load_cached_token()
+        token, saved_at = self._load_cached_token()
+        if token and self._token_is_fresh(saved_at):
+            log_status("Cached auth token is recent, skipping validation")
+            self._token = token
+            self._remember_token(token, saved_at)
+            return True
         if token and await self._validate_token(token):
             self._token = token
+            self._remember_token(token, datetime.now())
             return True
 
         # Obtain via browser
@@ -344,64 +768,100 @@ class PlanHubAPIClient:
 
     # -- HTTP helpers --------------------------------------------------------
 
+    def _bucket(self, url) -> _TokenBucket:
+        """Per-host rate limiter (PlanHub API vs. file CDNs are limited separately)."""
+        host = httpx.URL(url).host
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _TokenBucket(
+                self.config.API_RATE_LIMIT, self.config.API_RATE_BURST
+            )
+        return bucket
+
     async def _request(self, method, url, **kwargs):
         """
         Make an HTTP request with retry logic and automatic token refresh.
         Retries up to 3 times with exponential backoff.
         Re-authenticates on 401.
         """
+        bucket = self._bucket(url)
         for attempt in range(3):
             try:
-                r = await self._client.request(
-                    method, url, headers=self._headers(), **kwargs
-                )
+                await bucket.acquire()
+                async with self._sem:
+                    sent_token = self._token
+                    r = await self._client.request(
+                        method, url, headers=self._headers(), **kwargs
+                    )
 
                 # Token expired mid-run
                 if r.status_code == 401 and attempt < 2:
-                    log_status("Got 401 — refreshing auth token...")
-                    token = await self._obtain_token_via_browser()
-                    if token:
-                        self._token = token
-                        self._save_token(token)
+                    if await self._refresh_token(sent_token):
                         continue
                     return None
 
                 # Rate limited
                 if r.status_code == 429:
+                    bucket.slow_down()
                     retry_after = int(r.headers.get("Retry-After", 5))
-                    log_status(f"Rate limited, waiting {retry_after}s...")
+                    log_status(f"Rate limited, waiting {retry_after}s (now {bucket.rate:g} req/s)...")
                     await asyncio.sleep(retry_after)
                     continue
 
+                # Server says the window is exhausted: ease off before the 429
+                if r.headers.get("X-RateLimit-Remaining") == "0":
+                    bucket.slow_down()
+
                 if r.status_code >= 400:
                     body_preview = r.text[:200] if r.text else "(empty)"
                     log_status(f"HTTP {r.status_code} for {method} {url}: {body_preview}")
                     if attempt < 2:
-                        await asyncio.sleep(2 ** attempt)
+                        await asyncio.sleep(_backoff(attempt))
                         continue
                     return None
 
-                return r.json()
+                return _json_loads(r.content)
 
             except httpx.TimeoutException:
                 log_status(f"Timeout on {method} {url} (attempt {attempt + 1})")
                 if attempt < 2:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(_backoff(attempt))
             except Exception as e:
                 log_status(f"Request error: {e}")
                 if attempt < 2:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(_backoff(attempt))
 
         return None
 
+    async def _refresh_token(self, stale_token) -> bool:
+        """Replace *stale_token* after a 401, one browser login at a time.
+
+        Concurrent requests that hit the same expired token wait on the
+        lock; if another request has already swapped in a new token by
+        then, they simply retry with it.
+        """
+        async with self._refresh_lock:
+            if self._token != stale_token:
+                return True
+            log_status("Got 401 — refreshing auth token...")
+            token = await self._obtain_token_via_browser()
+            if not token:
+                return False
+            self._token = token
+            self._save_token(token)
+            return True
+
     # -- API methods ---------------------------------------------------------
 
     async def get_filtered_projects(self, page_num=0, limit=10):
         """POST /get-filtered-projects-multiple-keywords"""
+        bid_due_date_range = None
+        if self.config.FILTER_ACTIVE_ONLY:
+            bid_due_date_range = {"from": date.today().isoformat(), "to": None}
         body = {
             "filters": {
                 "assigned_team_members": [],
-                "bid_due_date_range": None,
+                "bid_due_date_range": bid_due_date_range,
                 "construction_types": [],
                 "date_range": None,
                 "delete": False,
@@ -440,45 +900,50 @@ class PlanHubAPIClient:
         }
         url = f"{self.config.API_BASE_URL}/get-filtered-projects-multiple-keywords"
         data = await self._request("POST", url, json=body)
-        _debug_dump(f"projects_page{page_num}", data)
+        if PLANHUB_DEBUG:
+            _debug_dump(f"projects_page{page_num}", data)
         return data
 
     async def get_project_details(self, project_id):
         """GET /{id}/get-details"""
         url = f"{self.config.API_BASE_URL}/{project_id}/get-details"
         data = await self._request("GET", url)
-        _debug_dump(f"details_{project_id}", data)
+        if PLANHUB_DEBUG:
+            _debug_dump(f"details_{project_id}", data)
         return data
 
     async def get_project_gc(self, project_id):
         """GET /{id}/get-gc"""
         url = f"{self.config.API_BASE_URL}/{project_id}/get-gc"
         data = await self._request("GET", url)
-        _debug_dump(f"gc_{project_id}", data)
+        if PLANHUB_DEBUG:
+            _debug_dump(f"gc_{project_id}", data)
         return data
 
     async def get_project_files(self, project_id):
         """GET /{id}/get-files"""
         url = f"{self.config.API_BASE_URL}/{project_id}/get-files"
         data = await self._request("GET", url)
-        _debug_dump(f"files_{project_id}", data)
+        if PLANHUB_DEBUG:
+            _debug_dump(f"files_{project_id}", data)
         return data
 
     async def download_file(self, url: str, dest_dir: str) -> str | None:
         """
-        Stream-download a file from *url* into *dest_dir*.
+        Stream-download a file from *url* into *dest_dir*, which must
+        already exist (callers create it once, not per file).
         Returns the local file path on success, None on failure.
         Tries with auth header first, then without.
         """
-        os.makedirs(dest_dir, exist_ok=True)
-
         # Derive filename from URL or Content-Disposition
         filename = url.split("/")[-1].split("?")[0] or "download"
 
         for use_auth in (True, False):
             try:
                 headers = self._headers() if use_auth else {}
-                async with self._client.stream("GET", url, headers=headers, follow_redirects=True) as r:
+                async with self._download_sem, self._client.stream(
+                    "GET", url, headers=headers, follow_redirects=True
+                ) as r:
                     if r.status_code >= 400:
                         if use_auth:
                             continue
@@ -490,9 +955,7 @@ class PlanHubAPIClient:
                         filename = cd.split("filename=")[-1].strip('" ')
 
                     dest = os.path.join(dest_dir, filename)
-                    with open(dest, "wb") as f:
-                        async for chunk in r.aiter_bytes(8192):
-                            f.write(chunk)
+                    await _stream_to_file(r, dest, self.config.DOWNLOAD_CHUNK_SIZE)
 
                     log_status(f"Downloaded: {filename}")
                     return dest
@@ -522,152 +985,269 @@ class PlanHubScraper:
         self.config = PlanHubConfig()
         self.leads = []
         self.processed_ids = set()
+        self._duplicates = 0  # repeats of processed_ids seen this run
+        # Set once a run has paged through to the genuine end of the project
+        # list; only then may the cache forget projects it didn't see
+        self._list_complete = False
         self.download_dir = self.config.DOWNLOAD_DIR
         os.makedirs(self.download_dir, exist_ok=True)
         self._api = PlanHubAPIClient(self.config)
+        self._has_sprinkler_keyword = _keyword_matcher(tuple(self.config.SPRINKLER_KEYWORDS))
+        self._trade = self.config.TRADE_FILTER
+        self._today_iso = date.today().isoformat()
+        # Stamped on every lead built in a run (see iter_leads)
+        self._extracted_at = datetime.now().isoformat()
+        # filename -> check_file_exists() result (None for misses)
+        self._gdrive_cache: dict[str, dict | None] = {}
+        self._gdrive_sem = asyncio.Semaphore(self.config.MAX_CONCURRENT_GDRIVE_CALLS)
+        # should_use_gdrive() reads and validates the OAuth token file, so it
+        # is resolved once per run (_resolve_gdrive) rather than per lead
+        self._gdrive_enabled = False
+        # lead id -> (fingerprint, encoded lead) from earlier runs (CACHE_FILE);
+        # leads are only decoded when their fingerprint still matches
+        self._cache: dict[str, tuple[str, bytes]] = {}
+        self._fingerprints: dict[str, str] = {}
+        # Checkpoint saves: run() owns the queue; ids this run added to DB_FILE
+        self._save_queue: asyncio.Queue | None = None
+        self._saved_ids: set[str] = set()
+        # Ids already handed to a checkpoint (database and cache) this run
+        self._checkpointed: set[str] = set()
+        # Ids whose leads changed after being built (file links added)
+        self._dirty_ids: set[str] = set()
+        # Last database contents we read or wrote, and the (mtime, size) it had
+        self._db: list | None = None
+        self._db_stat: tuple[int, int] | None = None
+        # Ids in the database (from the "<DB_FILE>.ids" sidecar when it is
+        # current), and the database (mtime, size) they describe
+        self._db_ids: set | None = None
+        self._db_ids_stat: tuple[int, int] | None = None
 
     # -- helpers -------------------------------------------------------------
 
+    # Field tables for _extract(): (output key, source keys in priority
+    # order, default when none of them has a value)
+    _PROJECT_FIELDS = (
+        ("name", ("name", "project_name", "title"), None),
+        ("description", ("desc", "description", "scope", "notes"), ""),
+        ("city", ("city", "project_city"), ""),
+        ("state", ("state", "province", "project_state"), ""),
+        ("zip", ("zip", "zipcode"), ""),
+        ("bid_date", ("bid_due_date", "bid_date", "bidDueDate", "due_date"), None),
+        ("value", ("value", "project_value", "estimated_value"), ""),
+        ("url", ("url", "project_url"), ""),
+        ("construction_type", ("construction_types", "construction_type"), ""),
+        ("building_use", ("building_use", "project_type"), ""),
+    )
+    _GC_CONTACT_FIELDS = (
+        ("company", ("name", "company_name", "company"), "N/A"),
+        ("contact_name", ("user_name", "contact_name", "contact", "full_name"), "N/A"),
+        ("contact_phone", ("phone_number", "phone", "contact_phone"), ""),
+        ("contact_email", ("email_address", "email", "contact_email"), ""),
+    )
+    _GC_ENTRY_FIELDS = (
+        ("company_name", ("company_name", "name", "company"), "N/A"),
+        ("user_name", ("user_name", "contact_name", "contact", "full_name"), ""),
+        ("phone_number", ("phone_number", "phone", "contact_phone"), ""),
+        ("email_address", ("email_address", "email", "contact_email"), ""),
+    )
+
     @staticmethod
-    def _get(obj, *keys, default="N/A"):
-        """Safely extract a value from a dict, trying multiple key names."""
+    def _extract(obj, fields):
+        """Pull every field of a _*_FIELDS table out of *obj* in one pass.
+
+        The first source key whose value isn't None, "" or the API's own
+        "N/A" placeholder wins, so callers can test fields for plain
+        truthiness.
+        """
         if not isinstance(obj, dict):
-            return default
-        for k in keys:
-            v = obj.get(k)
-            if v is not None and v != "":
-                return v
-        return default
+            return {key: default for key, _, default in fields}
+        get = obj.get
+        out = {}
+        for key, aliases, default in fields:
+            for alias in aliases:
+                value = get(alias)
+                if value is not None and value != "" and value != "N/A":
+                    break
+            else:
+                value = default
+            out[key] = value
+        return out
+
+    @staticmethod
+    def _intern(value):
+        """Intern short repeated strings so leads share one copy per value."""
+        return sys.intern(value) if isinstance(value, str) else value
 
     def parse_date(self, date_str):
         if not date_str or date_str == "N/A":
             return None
-        for fmt in DATE_FORMATS:
-            try:
-                return datetime.strptime(str(date_str).strip(), fmt).date()
-            except ValueError:
-                continue
-        # Try ISO format
-        try:
-            return datetime.fromisoformat(str(date_str).replace("Z", "+00:00")).date()
-        except Exception:
-            pass
-        return None
+        return _parse_date(str(date_str).strip())
+
+    @staticmethod
+    def _bid_date(proj):
+        """The raw bid due date of a project list item ("" if absent)."""
+        return (
+            proj.get("bid_due_date")
+            or proj.get("bid_date")
+            or proj.get("bidDueDate")
+            or ""
+        )
 
     def _is_past_due(self, date_str):
+        # Fast path: ISO "YYYY-MM-DD..." strings compare lexicographically,
+        # so a past date can be rejected without parsing.
+        head = str(date_str)[:10]
+        if len(head) == 10 and head[4] == "-" and head[7] == "-" and head[:4].isdigit():
+            if head < self._today_iso:
+                return True
         parsed = self.parse_date(date_str)
         if parsed and parsed < date.today():
             return True
         return False
 
     def _check_sprinkler(self, text):
+        """Keyword hit in *text*, which the caller has already lowercased."""
         if not text:
             return False
-        text_lower = text.lower()
-        return any(kw in text_lower for kw in self.config.SPRINKLER_KEYWORDS)
-
-    # -- file handling -------------------------------------------------------
+        return self._has_sprinkler_keyword(text)
 
-    async def _handle_files(self, lead, files_data):
-        """Download files and optionally upload to Google Drive."""
-        if not files_data:
-            return
+    async def _resolve_gdrive(self):
+        """Decide once per run whether leads' files go to Google Drive."""
+        self._gdrive_enabled = False
+        if GDRIVE_AVAILABLE:
+            try:
+                self._gdrive_enabled = await asyncio.to_thread(should_use_gdrive)
+            except Exception:
+                pass
 
-        # files_data could be a list or a dict with a list inside
-        file_list = files_data if isinstance(files_data, list) else files_data.get("files", files_data.get("data", []))
-        if not isinstance(file_list, list) or not file_list:
-            return
+    async def _gdrive_lookup(self, filename):
+        """check_file_exists() for PlanHub, memoized for the scraper's lifetime.
 
-        # Pre-check: does file already exist in Google Drive?
-        if GDRIVE_AVAILABLE and should_use_gdrive():
-            try:
-                project_name_clean = "".join(
-                    c for c in lead["name"][:60] if c.isalnum() or c in " -_"
-                ).strip()
-                existing = check_file_exists(f"{project_name_clean}.zip", source="PlanHub")
-                if not existing:
-                    existing = check_file_exists(f"{project_name_clean}.pdf", source="PlanHub")
-                if existing:
-                    log_status(f"File already in Google Drive, skipping download")
-                    lead["gdrive_file_id"] = existing.get("file_id")
-                    lead["gdrive_link"] = existing.get("web_link")
-                    lead["gdrive_download_link"] = existing.get("download_link")
-                    lead["download_link"] = existing.get("web_link")
-                    lead["storage_type"] = "gdrive"
-                    return
-            except Exception as e:
-                log_status(f"GDrive pre-check error: {e}")
-
-        # Pick the best download URL from the file list
-        download_url = None
-        for f in file_list:
-            if isinstance(f, dict):
-                download_url = (
-                    f.get("download_url")
-                    or f.get("downloadUrl")
-                    or f.get("download_link")
-                    or f.get("url")
-                    or f.get("file_url")
-                    or f.get("fileUrl")
+        The Drive client is synchronous, so the lookup runs in a thread to
+        keep the event loop (and any in-flight downloads) moving.
+        """
+        if filename not in self._gdrive_cache:
+            async with self._gdrive_sem:
+                self._gdrive_cache[filename] = await asyncio.to_thread(
+                    check_file_exists, filename, source="PlanHub"
                 )
-                if download_url:
-                    break
+        return self._gdrive_cache[filename]
+
+    async def _find_in_gdrive(self, project_name_clean):
+        """Look for the project's .zip and .pdf in Drive concurrently (.zip wins)."""
+        zip_hit, pdf_hit = await asyncio.gather(
+            self._gdrive_lookup(f"{project_name_clean}.zip"),
+            self._gdrive_lookup(f"{project_name_clean}.pdf"),
+        )
+        return zip_hit or pdf_hit
+
+    # -- run cache -----------------------------------------------------------
+
+    # The lead is stored whole as JSON text; the columns worth querying
+    # are generated from it, so a write marshals one value per lead.
+    # Bump _CACHE_VERSION whenever the schema changes (the cache is rebuilt).
+    _CACHE_VERSION = 2
+    _CACHE_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            bid_date TEXT GENERATED ALWAYS AS (json_extract(payload, '$.bid_date')) VIRTUAL,
+            state TEXT GENERATED ALWAYS AS (json_extract(payload, '$.state')) VIRTUAL,
+            sprinklered INTEGER GENERATED ALWAYS AS (json_extract(payload, '$.sprinklered')) VIRTUAL
+        );
+        CREATE INDEX IF NOT EXISTS projects_bid_date ON projects (bid_date);
+    """
 
-        if not download_url:
-            log_status("No downloadable file URL found")
-            return
+    def _open_cache(self):
+        """Connect to the cache database (one short-lived connection per call)."""
+        conn = sqlite3.connect(self.config.CACHE_FILE)
+        # WAL: the writer thread's checkpoint saves don't block readers
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != self._CACHE_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS projects;"
+                f"{self._CACHE_SCHEMA}"
+                f"PRAGMA user_version = {self._CACHE_VERSION};"
+            )
+        return conn
 
-        local_path = await self._api.download_file(download_url, self.download_dir)
-        if not local_path:
-            return
+    def _load_cache(self):
+        """Load fingerprints (and still-encoded leads) from previous runs.
 
-        new_file = os.path.basename(local_path)
+        Projects already past due are dropped first: the scrape skips them
+        before it ever looks at the cache.
+        """
+        try:
+            with closing(self._open_cache()) as conn:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM projects WHERE bid_date < ?"
+                        " AND bid_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'",
+                        (date.today().isoformat(),),
+                    )
+                self._cache = {
+                    row[0]: (row[1], row[2])
+                    for row in conn.execute("SELECT id, fingerprint, payload FROM projects")
+                }
+            log_status(f"Loaded {len(self._cache)} cached projects")
+        except Exception as e:
+            log_status(f"Could not read cache database: {e}")
+            self._cache = {}
 
-        # Upload to Google Drive if available
-        use_gdrive = False
-        if GDRIVE_AVAILABLE:
-            try:
-                use_gdrive = should_use_gdrive()
-                if not use_gdrive:
-                    gdrive_status = get_status()
-                    if gdrive_status.get("configured") and not gdrive_status.get("authenticated"):
-                        from services.google_drive import authenticate
-                        if authenticate():
-                            use_gdrive = True
-            except Exception:
-                pass
+    def _write_cache(self, leads):
+        """Upsert *leads* with their source fingerprints.
 
-        if use_gdrive:
-            try:
-                project_name_clean = "".join(
-                    c for c in lead["name"][:60] if c.isalnum() or c in " -_"
-                ).strip()
-                ext = os.path.splitext(new_file)[1] or ".zip"
-                gdrive_filename = f"{project_name_clean}{ext}"
-
-                result = upload_and_cleanup(
-                    local_path,
-                    filename=gdrive_filename,
-                    source="PlanHub",
-                    delete_local=True,
+        All rows go in one executemany inside a single transaction, so a
+        checkpoint costs one commit rather than one per lead.
+        """
+        rows = [
+            (
+                lead["id"],
+                self._fingerprints[lead["id"]],
+                orjson.dumps(lead) if orjson else json.dumps(lead),
+            )
+            for lead in leads
+            if lead["id"] in self._fingerprints
+        ]
+        try:
+            with closing(self._open_cache()) as conn, conn:
+                # orjson gives bytes; CAST stores them as TEXT for json_extract
+                conn.executemany(
+                    "INSERT OR REPLACE INTO projects (id, fingerprint, payload)"
+                    " VALUES (?, ?, CAST(? AS TEXT))",
+                    rows,
                 )
-                if result:
-                    lead["gdrive_file_id"] = result.get("file_id")
-                    lead["gdrive_link"] = result.get("web_link")
-                    lead["gdrive_download_link"] = result.get("download_link")
-                    lead["download_link"] = result.get("web_link")
-                    lead["storage_type"] = "gdrive"
-                    log_status(f"Uploaded to Google Drive: {gdrive_filename}")
-                    return
-            except Exception as e:
-                log_status(f"Google Drive upload failed: {e}")
+        except Exception as e:
+            log_status(f"Could not save cache database: {e}")
 
-        # Fall back to local storage
-        web_path = f"/downloads/{new_file}"
-        lead["local_file_path"] = web_path
-        lead["download_link"] = web_path
-        lead["storage_type"] = "local"
-        log_status(f"Saved locally: {web_path}")
+    def _prune_cache(self):
+        """Drop projects that weren't in this (complete) run's project list."""
+        try:
+            with closing(self._open_cache()) as conn, conn:
+                stale = [(pid,) for pid in self._cache.keys() - self._fingerprints.keys()]
+                conn.executemany("DELETE FROM projects WHERE id = ?", stale)
+        except Exception as e:
+            log_status(f"Could not prune cache database: {e}")
+
+    @staticmethod
+    def _fingerprint(proj):
+        """Stable digest of a raw project list item, to detect changes between runs."""
+        raw = json.dumps(proj, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _restore_cached_lead(self, lead):
+        """Reuse a cached lead, dropping local file links whose file was cleaned up."""
+        local = lead.get("local_file_path")
+        if lead.get("storage_type") == "local" and local:
+            path = os.path.join(self.download_dir, local.removeprefix("/downloads/"))
+            if not os.path.exists(path):
+                lead["local_file_path"] = None
+                lead["download_link"] = None
+                lead["storage_type"] = None
+        return lead
 
     # -- browser file download ------------------------------------------------
 
@@ -681,104 +1261,82 @@ class PlanHubScraper:
         if not leads:
             return
 
-        leads_to_download = []
+        queue = asyncio.Queue()
         for lead in leads:
-            # Skip if already have files from this run
-            if lead.get("download_link") or lead.get("local_file_path") or lead.get("gdrive_link"):
-                continue
-            # Check Google Drive for existing file
-            if GDRIVE_AVAILABLE and should_use_gdrive():
-                try:
-                    project_name_clean = "".join(
-                        c for c in lead.get("name", "")[:60] if c.isalnum() or c in " -_"
-                    ).strip()
-                    if project_name_clean:
-                        existing = check_file_exists(f"{project_name_clean}.zip", source="PlanHub")
-                        if not existing:
-                            existing = check_file_exists(f"{project_name_clean}.pdf", source="PlanHub")
-                        if existing:
-                            log_status(f"  File already in Google Drive: {project_name_clean}")
-                            lead["gdrive_file_id"] = existing.get("file_id")
-                            lead["gdrive_link"] = existing.get("web_link")
-                            lead["gdrive_download_link"] = existing.get("download_link")
-                            lead["download_link"] = existing.get("web_link")
-                            lead["storage_type"] = "gdrive"
-                            continue
-                except Exception as e:
-                    log_status(f"  GDrive pre-check error: {e}")
-            leads_to_download.append(lead)
-        if not leads_to_download:
-            log_status("All leads already have files, skipping browser download")
-            return
-
-        log_status(f"Downloading files for {len(leads_to_download)} projects via browser...")
+            queue.put_nowait(lead)
+        queue.put_nowait(None)
+        await self._download_worker(queue)
+
+    async def _needs_download(self, lead) -> bool:
+        """False if the lead already has files (this run, cache or Google Drive)."""
+        # Skip if already have files from this run
+        if lead.get("download_link") or lead.get("local_file_path") or lead.get("gdrive_link"):
+            return False
+        # Check Google Drive for existing file
+        if self._gdrive_enabled:
+            try:
+                project_name_clean = "".join(
+                    c for c in lead.get("name", "")[:60] if c.isalnum() or c in " -_"
+                ).strip()
+                if project_name_clean:
+                    existing = await self._find_in_gdrive(project_name_clean)
+                    if existing:
+                        log_status(f"  File already in Google Drive: {project_name_clean}")
+                        lead["gdrive_file_id"] = existing.get("file_id")
+                        lead["gdrive_link"] = existing.get("web_link")
+                        lead["gdrive_download_link"] = existing.get("download_link")
+                        lead["download_link"] = existing.get("web_link")
+                        lead["storage_type"] = "gdrive"
+                        self._dirty_ids.add(lead["id"])
+                        return False
+            except Exception as e:
+                log_status(f"  GDrive pre-check error: {e}")
+        return True
 
-        try:
-            from playwright.async_api import async_playwright
-        except ImportError:
-            log_status("Playwright not installed, skipping file downloads")
-            return
+    async def _download_worker(self, queue):
+        """Download files for leads arriving on *queue* until a None sentinel.
 
-        pw = None
-        ctx = None
+        The shared browser session is opened lazily for the first lead that
+        actually needs files, so it can start up while scraping is still
+        producing leads.  It is closed with the API client at the end of
+        run().
+        """
+        page = None
+        downloaded = 0
         try:
-            pw = await async_playwright().start()
-            chrome_path = self._api._find_chrome_executable()
-
-            # Clean up stale SingletonLock from previous crashes
-            lock_file = os.path.join(self.config.CHROME_USER_DATA_DIR, "SingletonLock")
-            if os.path.exists(lock_file):
-                try:
-                    os.remove(lock_file)
-                    log_status("Removed stale SingletonLock file")
-                except OSError:
-                    pass
-
-            ctx = await pw.chromium.launch_persistent_context(
-                user_data_dir=self.config.CHROME_USER_DATA_DIR,
-                headless=self.config.HEADLESS,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-gpu",
-                    "--mute-audio",
-                ],
-                executable_path=chrome_path,
-                viewport={"width": 1280, "height": 900},
-                ignore_https_errors=True,
-                accept_downloads=True,
-            )
-
-            page = ctx.pages[0] if ctx.pages else await ctx.new_page()
+            while (lead := await queue.get()) is not None:
+                if not await self._needs_download(lead):
+                    continue
 
-            for i, lead in enumerate(leads_to_download):
+                if page is None:
+                    try:
+                        import playwright  # noqa: F401
+                    except ImportError:
+                        log_status("Playwright not installed, skipping file downloads")
+                        return
+                    log_status("Starting browser for project file downloads...")
+                    page = await self._api.browser.main_page()
+
+                downloaded += 1
                 project_id = lead["id"].replace("planhub_", "")
                 project_name = lead.get("name", "Unknown")[:50]
-                log_status(f"[{i+1}/{len(leads_to_download)}] Downloading files: {project_name}")
+                log_status(f"[{downloaded}] Downloading files: {project_name}")
 
                 try:
                     await self._download_single_project_files(page, lead, project_id)
                 except Exception as e:
                     log_status(f"  -> File download failed for {project_name}: {e}")
+                self._dirty_ids.add(lead["id"])
+                self._request_save()
 
                 await asyncio.sleep(1)  # Polite delay between projects
 
+            if not downloaded:
+                log_status("All leads already have files, skipping browser download")
+
         except Exception as e:
             log_status(f"Browser file download session failed: {e}")
-            traceback.print_exc()
-        finally:
-            if ctx:
-                try:
-                    await ctx.close()
-                except Exception:
-                    pass
-            if pw:
-                try:
-                    await pw.stop()
-                except Exception:
-                    pass
+            logger.exception("Browser file download session failed")
 
     async def _download_single_project_files(self, page, lead, project_id):
         """Navigate to a single project page and download its files.
@@ -1037,6 +1595,8 @@ class PlanHubScraper:
                         # PlanHub may take several seconds to open the download tab
                         await asyncio.sleep(5)
                         for np in new_pages:
+                            if np in self._api.browser.private_pages:
+                                continue  # token-refresh tab, not a download
                             try:
                                 np_url = np.url
                                 log_status(f"  -> Popup tab: {np_url[:100]}")
@@ -1060,11 +1620,9 @@ class PlanHubScraper:
                     # Check captured network URLs
                     if not download_started and captured_file_urls:
                         log_status(f"  -> Trying {len(captured_file_urls)} captured URLs...")
-                        for cap_url in captured_file_urls:
-                            dest_path = await self._download_captured_url(cap_url, lead)
-                            if dest_path:
-                                download_started = True
-                                break
+                        dest_path = await self._race_captured_urls(captured_file_urls, lead)
+                        if dest_path:
+                            download_started = True
                 else:
                     log_status("  -> 'Download Now' button never appeared (server timeout?)")
 
@@ -1108,7 +1666,11 @@ class PlanHubScraper:
             dest_path = os.path.join(project_dir, suggested)
             await download.save_as(dest_path)
 
-            file_size = os.path.getsize(dest_path) if os.path.exists(dest_path) else 0
+            try:
+                file_size = os.stat(dest_path).st_size
+            except FileNotFoundError:
+                log_status(f"  -> Download missing after save: {suggested}")
+                return None
             log_status(f"  -> Downloaded: {suggested} ({file_size:,} bytes)")
 
             if file_size < 100:
@@ -1126,76 +1688,149 @@ class PlanHubScraper:
             log_status(f"  -> Failed to save download: {e}")
             return None
 
+    @staticmethod
+    def _project_dir(download_dir, lead):
+        """(cleaned project name, its folder under *download_dir*), creating the folder."""
+        project_name_clean = "".join(
+            c for c in lead["name"][:60] if c.isalnum() or c in " -_"
+        ).strip()
+        project_dir = os.path.join(download_dir, project_name_clean)
+        os.makedirs(project_dir, exist_ok=True)
+        return project_name_clean, project_dir
+
+    async def _race_captured_urls(self, urls, lead, limit=8) -> str | None:
+        """Try several captured URLs concurrently; keep the first that succeeds.
+
+        The URLs usually point at different CDNs, so awaiting them one by one
+        wastes time on dead links.  Each attempt downloads into its own
+        scratch folder (differently signed URLs for one object resolve to
+        the same filename) and leaves *lead* alone; once one succeeds the
+        rest are cancelled, and only then is the winner moved into place,
+        recorded on the lead and uploaded.
+        """
+        # Dedupe: the response hook can capture the same URL twice
+        unique_urls = list(dict.fromkeys(urls))[:limit]
+        project_name_clean, project_dir = self._project_dir(self.download_dir, lead)
+        scratch = [tempfile.mkdtemp(prefix=".race-", dir=project_dir) for _ in unique_urls]
+        tasks = [
+            asyncio.create_task(self._fetch_captured_url(u, d))
+            for u, d in zip(unique_urls, scratch)
+        ]
+        winner = None
+        pending = set(tasks)
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in tasks:
+                    if task in done and not task.cancelled() and task.exception() is None and task.result():
+                        winner = task.result()
+                        break
+            if winner is not None:
+                final = os.path.join(project_dir, os.path.basename(winner))
+                try:
+                    os.replace(winner, final)
+                    winner = final
+                except OSError as e:
+                    log_status(f"  -> Could not keep download: {e}")
+                    winner = None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for d in scratch:
+                shutil.rmtree(d, ignore_errors=True)
+        if winner is None:
+            return None
+        return await self._keep_captured_download(winner, lead, project_name_clean)
+
     async def _download_captured_url(self, url: str, lead) -> str | None:
         """Download a file from a captured URL using httpx and update the lead."""
         try:
-            project_name_clean = "".join(
-                c for c in lead["name"][:60] if c.isalnum() or c in " -_"
-            ).strip()
-            project_dir = os.path.join(self.download_dir, project_name_clean)
-            os.makedirs(project_dir, exist_ok=True)
+            project_name_clean, project_dir = self._project_dir(self.download_dir, lead)
+        except OSError as e:
+            log_status(f"  -> HTTP download failed: {e}")
+            return None
+        dest_path = await self._fetch_captured_url(url, project_dir)
+        if not dest_path:
+            return None
+        return await self._keep_captured_download(dest_path, lead, project_name_clean)
 
+    async def _fetch_captured_url(self, url: str, dest_dir: str) -> str | None:
+        """Download *url* into *dest_dir*; returns the saved path or None.
+
+        Doesn't touch any lead, so concurrent attempts can't clobber each
+        other's results.  Files too small to be real (error pages) are
+        removed.
+        """
+        try:
             # Derive filename from URL
             filename = url.split("/")[-1].split("?")[0] or "download"
-            if not any(filename.lower().endswith(ext) for ext in (".pdf", ".zip", ".dwg", ".dwf", ".doc", ".docx", ".xls", ".xlsx")):
+            _, dot, ext = filename.rpartition(".")
+            if not dot or ext.lower() not in _KNOWN_FILE_EXTS:
                 filename = f"{filename}.pdf"
 
             log_status(f"  -> Downloading via HTTP: {url[:80]}...")
 
             # Try with auth first, then without
-            dest_path = await self._api.download_file(url, project_dir)
+            dest_path = await self._api.download_file(url, dest_dir)
             if not dest_path:
-                # Try without auth using a fresh client
-                async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
-                    async with client.stream("GET", url) as r:
-                        if r.status_code >= 400:
-                            log_status(f"  -> HTTP {r.status_code} downloading {url[:60]}")
-                            return None
-
-                        cd = r.headers.get("content-disposition", "")
-                        if "filename=" in cd:
-                            filename = cd.split("filename=")[-1].strip('" ')
-
-                        dest_path = os.path.join(project_dir, filename)
-                        with open(dest_path, "wb") as f:
-                            async for chunk in r.aiter_bytes(8192):
-                                f.write(chunk)
-
-            if not dest_path or not os.path.exists(dest_path):
+                # Try without auth or API headers/cookies
+                client = self._api.plain_client()
+                async with self._api._download_sem, client.stream("GET", url) as r:
+                    if r.status_code >= 400:
+                        log_status(f"  -> HTTP {r.status_code} downloading {url[:60]}")
+                        return None
+
+                    cd = r.headers.get("content-disposition", "")
+                    if "filename=" in cd:
+                        filename = cd.split("filename=")[-1].strip('" ')
+
+                    dest_path = os.path.join(dest_dir, filename)
+                    await _stream_to_file(r, dest_path, self.config.DOWNLOAD_CHUNK_SIZE)
+
+            if not dest_path:
+                return None
+            try:
+                file_size = os.stat(dest_path).st_size
+            except FileNotFoundError:
                 return None
 
-            file_size = os.path.getsize(dest_path)
             if file_size < 100:
                 log_status(f"  -> File too small ({file_size} bytes), likely error")
                 os.remove(dest_path)
                 return None
-
-            actual_filename = os.path.basename(dest_path)
-            log_status(f"  -> Saved: {actual_filename} ({file_size:,} bytes)")
-
-            lead["local_file_path"] = f"/downloads/{project_name_clean}/{actual_filename}"
-            lead["download_link"] = lead["local_file_path"]
-            lead["storage_type"] = "local"
-
-            await self._upload_to_gdrive(lead, dest_path, project_name_clean, actual_filename)
             return dest_path
         except Exception as e:
             log_status(f"  -> HTTP download failed: {e}")
             return None
 
+    async def _keep_captured_download(self, dest_path, lead, project_name_clean) -> str | None:
+        """Record a finished download on *lead* and upload it to Drive."""
+        actual_filename = os.path.basename(dest_path)
+        try:
+            file_size = os.stat(dest_path).st_size
+        except OSError:
+            return None
+        log_status(f"  -> Saved: {actual_filename} ({file_size:,} bytes)")
+
+        lead["local_file_path"] = f"/downloads/{project_name_clean}/{actual_filename}"
+        lead["download_link"] = lead["local_file_path"]
+        lead["storage_type"] = "local"
+
+        await self._upload_to_gdrive(lead, dest_path, project_name_clean, actual_filename)
+        return dest_path
+
     async def _upload_to_gdrive(self, lead, local_path, project_name_clean, filename):
         """Upload a downloaded file to Google Drive if available."""
-        if not GDRIVE_AVAILABLE:
-            return
-        try:
-            if not should_use_gdrive():
-                return
-        except Exception:
+        if not self._gdrive_enabled:
             return
 
         try:
             # Check if already uploaded
-            existing = check_file_exists(filename, source="PlanHub")
+            existing = await self._gdrive_lookup(filename)
             if existing:
                 lead["gdrive_file_id"] = existing.get("file_id")
                 lead["gdrive_link"] = existing.get("web_link")
@@ -1207,13 +1842,15 @@ class PlanHubScraper:
             ext = os.path.splitext(filename)[1] or ".zip"
             gdrive_filename = f"{project_name_clean}{ext}"
 
-            result = upload_and_cleanup(
+            result = await asyncio.to_thread(
+                upload_and_cleanup,
                 local_path,
                 filename=gdrive_filename,
                 source="PlanHub",
                 delete_local=True,
             )
             if result:
+                self._gdrive_cache[gdrive_filename] = result
                 lead["gdrive_file_id"] = result.get("file_id")
                 lead["gdrive_link"] = result.get("web_link")
                 lead["gdrive_download_link"] = result.get("download_link")
@@ -1226,249 +1863,616 @@ class PlanHubScraper:
     # -- main scraping -------------------------------------------------------
 
     async def scrape_all_projects(self, max_projects=None):
-        """Fetch projects from PlanHub API and enrich each one."""
+        """Fetch projects from PlanHub API and collect them into self.leads."""
+        async for lead in self.iter_leads(max_projects):
+            self.leads.append(lead)
+        log_status(f"SCRAPING COMPLETE - Total leads: {len(self.leads)}")
+        return self.leads
+
+    async def iter_leads(self, max_projects=None):
+        """Yield leads one at a time as the project list is paged.
+
+        The project list is paged into a bounded queue that a small pool of
+        workers drains, and built leads are handed back through a second
+        bounded queue.  Nothing is accumulated here, so a caller that
+        processes leads as they arrive keeps memory flat regardless of how
+        many projects the filter matches.
+        """
         log_status("=" * 40)
         log_status("Starting PlanHub API scrape")
 
         if max_projects is None:
             max_projects = self.config.MAX_PROJECTS_DEFAULT
 
+        # Past-due cutoff and extraction timestamp are fixed for the whole run
+        now = datetime.now()
+        self._today_iso = now.date().isoformat()
+        self._extracted_at = now.isoformat()
+        self._duplicates = 0
+        self._list_complete = False
+
         # 1. Auth
-        if not await self._api.ensure_auth():
+        if not await self._api.wait_auth():
             log_status("Failed to authenticate with PlanHub API")
-            return []
+            return
 
-        # 2. Paginate project list
+        # 2. Paginate project list into the worker queue
         log_status("Fetching project list...")
-        all_projects = []
+        queue = asyncio.Queue(maxsize=self.config.PROJECT_QUEUE_SIZE)
+        out = asyncio.Queue(maxsize=self.config.PROJECT_QUEUE_SIZE)
+        workers = [
+            asyncio.create_task(self._lead_worker(queue, out))
+            for _ in range(self.config.SCRAPE_WORKERS)
+        ]
+
+        async def _produce_then_close():
+            try:
+                fetched, complete = await self._produce_projects(queue, max_projects)
+                await queue.join()
+                self._list_complete = complete
+                log_status(f"Fetched {fetched} total projects from API")
+                if self._duplicates:
+                    log_status(f"Skipped {self._duplicates} duplicate projects")
+            finally:
+                await out.put(None)
+
+        producer = asyncio.create_task(_produce_then_close())
+        try:
+            while (lead := await out.get()) is not None:
+                yield lead
+            await producer  # surface producer errors
+        finally:
+            for task in (producer, *workers):
+                task.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
+
+    async def _produce_projects(self, queue, max_projects):
+        """Page through the project list, feeding ``(index, total, proj)`` into *queue*.
+
+        Returns ``(fetched, complete)``: the number of projects enqueued, and
+        whether paging stopped at the real end of the list (a short page,
+        ``total`` reached or the past-due cutoff) rather than on a failed or
+        empty page or the max_projects limit.
+        """
+        fetched = 0
+        complete = False
+        total = None
         page_num = 0
         page_size = 25
+        projects_path = None
+
+        # Pages are prefetched: up to PAGE_PREFETCH requests stay in flight
+        # (still bounded by the client's semaphore and rate limit) while
+        # earlier pages are queued up for the workers. Page 0 goes alone,
+        # since it is what tells us how many pages there are.
+        pending = deque()
+        requested = 0
+        last_page = 0
+
+        def prefetch():
+            nonlocal requested
+            window = self.config.PAGE_PREFETCH if total is not None else 1
+            while len(pending) < window and requested <= last_page:
+                pending.append(asyncio.create_task(
+                    self._api.get_filtered_projects(requested, page_size)
+                ))
+                requested += 1
+
+        prefetch()
+        try:
+            while True:
+                data = await pending.popleft()
+                if not data:
+                    log_status(f"No data returned for page {page_num} (response was None/empty)")
+                    break
 
-        while True:
-            data = await self._api.get_filtered_projects(page_num, page_size)
-            if not data:
-                log_status(f"No data returned for page {page_num} (response was None/empty)")
-                break
-
-            # Debug: log response structure
-            if page_num == 0:
-                if isinstance(data, dict):
-                    log_status(f"API response keys: {list(data.keys())}")
-                    result = data.get("result")
-                    if isinstance(result, dict):
-                        log_status(f"result keys: {list(result.keys())}, total_projects: {result.get('total_projects')}")
+                # Debug: log response structure
+                if page_num == 0:
+                    if isinstance(data, dict):
+                        log_status(f"API response keys: {list(data.keys())}")
+                        result = data.get("result")
+                        if isinstance(result, dict):
+                            log_status(f"result keys: {list(result.keys())}, total_projects: {result.get('total_projects')}")
+                    else:
+                        log_status(f"API response type: {type(data).__name__}")
+
+                # Response is {"result": {"total_projects": N, "projects": [...]}}
+                # Unwrap the "result" envelope if present
+                inner = data.get("result", data) if isinstance(data, dict) else data
+
+                # Every page has the same shape, so only page 0 pays for the
+                # key search; later pages follow the path it found
+                projects = self._follow(data, projects_path)
+                if not projects:
+                    projects, projects_path = self._locate_projects(data, inner)
+                if not projects:
+                    log_status(f"No projects found on page {page_num}")
+                    break
+
+                # Total project count (for progress logging and the stop check)
+                if total is None:
+                    if isinstance(inner, dict):
+                        total = inner.get("total_projects") or inner.get("total") or inner.get("totalCount")
+                    if total is None and isinstance(data, dict):
+                        total = data.get("total") or data.get("totalCount") or data.get("total_count")
+                    if total is not None:
+                        total = int(total)
+                        if max_projects:
+                            total = min(total, max_projects)
+                        last_page = max(0, (total - 1) // page_size)
+
+                page_count = len(projects)
+                if max_projects:
+                    projects = projects[:max_projects - fetched]
+                end = fetched + len(projects)
+
+                # Work out whether there is a next page before enqueueing this
+                # one, so its fetch overlaps with the workers draining the queue
+                last = projects[-1]
+                if max_projects and end >= max_projects:
+                    more = False  # have enough
+                elif isinstance(last, dict) and self._is_past_due(self._bid_date(last)):
+                    # The list comes ordered by bid_due_date descending, so once a
+                    # page ends past due every later page is past due as well
+                    log_status(f"Page {page_num} ends past due, stopping pagination")
+                    more = False
+                    complete = True
+                elif total is not None and end >= total:
+                    more = False  # no more pages
+                    complete = True
                 else:
-                    log_status(f"API response type: {type(data).__name__}")
-
-            # Response is {"result": {"total_projects": N, "projects": [...]}}
-            # Unwrap the "result" envelope if present
-            inner = data.get("result", data) if isinstance(data, dict) else data
-
-            projects = None
-            if isinstance(inner, dict):
-                projects = (
-                    inner.get("projects")
-                    or inner.get("data")
-                    or inner.get("results")
-                    or inner.get("items")
-                )
-            if not projects and isinstance(inner, list):
-                projects = inner
-            if not projects and isinstance(data, dict):
-                # Last resort: find any list in the response
-                for v in data.values():
-                    if isinstance(v, dict):
-                        for vv in v.values():
-                            if isinstance(vv, list) and vv:
-                                projects = vv
-                                break
-                    if isinstance(v, list) and v:
-                        projects = v
-                        break
-            if not projects:
-                log_status(f"No projects found on page {page_num}")
-                break
-
-            all_projects.extend(projects)
-            log_status(f"Page {page_num}: got {len(projects)} projects (total: {len(all_projects)})")
-
-            # Check if we have enough
-            if max_projects and len(all_projects) >= max_projects:
-                all_projects = all_projects[:max_projects]
-                break
-
-            # Check if there are more pages
-            total = None
-            if isinstance(inner, dict):
-                total = inner.get("total_projects") or inner.get("total") or inner.get("totalCount")
-            if total is None and isinstance(data, dict):
-                total = data.get("total") or data.get("totalCount") or data.get("total_count")
-            if total is not None and len(all_projects) >= int(total):
-                break
-
-            # If we got fewer than requested, we're on the last page
-            if len(projects) < page_size:
-                break
-
-            page_num += 1
-            await asyncio.sleep(0.3)
-
-        log_status(f"Fetched {len(all_projects)} total projects from API")
-
-        if not all_projects:
-            return []
-
-        # 3. Process each project from list data
-        log_status("Processing projects from API response...")
-
-        for i, proj in enumerate(all_projects):
-            project_id = str(
-                proj.get("id")
-                or proj.get("project_id")
-                or proj.get("projectId")
-                or proj.get("_id")
-                or i
-            )
-            project_name = (
-                proj.get("project_name")
-                or proj.get("name")
-                or proj.get("title")
-                or "Unknown"
-            )
+                    # If we got fewer than requested, we're on the last page
+                    more = page_count >= page_size
+                    complete = not more
+                if more:
+                    if total is None:
+                        last_page = page_num + 1
+                    prefetch()
+
+                for proj in projects:
+                    await queue.put((fetched, total, proj))
+                    fetched += 1
+                log_status(f"Page {page_num}: got {page_count} projects (total: {fetched})")
+
+                if not more:
+                    break
+                page_num += 1
+        finally:
+            # Speculative fetches past the last useful page are dropped
+            for task in pending:
+                task.cancel()
 
-            lead_id = f"planhub_{project_id}"
-            if lead_id in self.processed_ids:
-                log_status(f"Skipping duplicate: {lead_id}")
-                continue
-            self.processed_ids.add(lead_id)
-
-            # Quick past-due check from list data
-            bid_date_str = (
-                proj.get("bid_due_date")
-                or proj.get("bid_date")
-                or proj.get("bidDueDate")
-                or ""
-            )
-            if bid_date_str and self._is_past_due(bid_date_str):
-                log_status(f"Skipping past-due: {project_name[:40]}")
-                continue
-
-            log_status(f"[{i+1}/{len(all_projects)}] Processing: {project_name[:50]}")
-
-            # --- Extract all data from the project list item directly ---
-            # (Per-project enrichment endpoints return 404, but the list has everything)
-            name = self._get(proj, "name", "project_name", "title", default=project_name)
-            description = self._get(proj, "desc", "description", "scope", "notes", default="")
-            city = self._get(proj, "city", "project_city", default="")
-            state = self._get(proj, "state", "province", "project_state", default="")
-            zip_code = self._get(proj, "zip", "zipcode", default="")
-            bid_date = self._get(
-                proj, "bid_due_date", "bid_date", "bidDueDate", "due_date",
-                default=bid_date_str or "N/A",
-            )
-            project_value = self._get(proj, "value", "project_value", "estimated_value", default="")
-            project_url = self._get(proj, "url", "project_url", default="")
-            construction_type = self._get(proj, "construction_types", "construction_type", default="")
-            building_use = self._get(proj, "building_use", "project_type", default="")
+        return fetched, complete
 
-            location = f"{city}, {state}" if city and state and city != "N/A" and state != "N/A" else (city or state or "N/A")
+    @staticmethod
+    def _follow(data, path):
+        """Walk *path* (a tuple of keys) into *data*; None if it doesn't lead to a list."""
+        if path is None:
+            return None
+        for key in path:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data if isinstance(data, list) else None
 
-            # Full address
-            parts = [p for p in [city, state, zip_code] if p and p != "N/A"]
-            full_address = ", ".join(parts) if parts else location
+    @staticmethod
+    def _locate_projects(data, inner):
+        """Find the project list in a page response.
 
-            # Sprinkler check
-            sprinklered = self._check_sprinkler(description) or self._check_sprinkler(name)
-
-            # GC info — extract from general_contractors array in the list item
-            gc_company = "N/A"
-            contact_name = "N/A"
-            contact_phone = ""
-            contact_email = ""
-            planhub_gcs = []
-            gc_list = proj.get("general_contractors") or []
-            if isinstance(gc_list, list) and gc_list:
-                gc = gc_list[0]
-                gc_company = self._get(gc, "name", "company_name", "company", default="N/A")
-                contact_name = self._get(gc, "user_name", "contact_name", "contact", "full_name", default="N/A")
-                contact_phone = self._get(gc, "phone_number", "phone", "contact_phone", default="")
-                contact_email = self._get(gc, "email_address", "email", "contact_email", default="")
-                # Store all GCs for display in the details panel
-                for gc_entry in gc_list:
-                    planhub_gcs.append({
-                        "company_name": self._get(gc_entry, "company_name", "name", "company", default="N/A"),
-                        "user_name": self._get(gc_entry, "user_name", "contact_name", "contact", "full_name", default=""),
-                        "phone_number": self._get(gc_entry, "phone_number", "phone", "contact_phone", default=""),
-                        "email_address": self._get(gc_entry, "email_address", "email", "contact_email", default=""),
-                    })
-
-            # Build URL
-            if not project_url or project_url == "N/A":
-                project_url = f"https://supplier.planhub.com/project/{project_id}"
-
-            # Build type string from construction_types + building_use
-            type_parts = [p for p in [construction_type, building_use] if p and p != "N/A"]
-            project_type = " / ".join(type_parts) if type_parts else ""
-
-            lead = {
-                "id": lead_id,
-                "name": name,
-                "gc": gc_company,
-                "company": gc_company,
-                "contact_name": contact_name,
-                "contact_phone": contact_phone,
-                "contact_email": contact_email,
-                "bid_date": bid_date,
-                "due_date": bid_date,
-                "site": "PlanHub",
-                "source": "PlanHub",
-                "sprinklered": sprinklered,
-                "location": location,
-                "city": city if city and city != "N/A" else (location.split(",")[0].strip() if "," in location else location),
-                "state": state if state and state != "N/A" else (location.split(",")[1].strip() if "," in location else "N/A"),
-                "trade": self.config.TRADE_FILTER,
-                "description": description if description != "N/A" else "",
-                "full_address": full_address,
-                "url": project_url,
-                "value": project_value if project_value != "N/A" else "",
-                "project_type": project_type,
-                "extracted_at": datetime.now().isoformat(),
-                "files_link": None,
-                "download_link": None,
-                "local_file_path": None,
-                "planhub_gcs": planhub_gcs if len(planhub_gcs) > 1 else [],
-            }
+        Returns ``(projects, path)`` where *path* is the key tuple that
+        reaches the list from *data*, for reuse with _follow().
+        """
+        prefix = ("result",) if inner is not data else ()
+        if isinstance(inner, dict):
+            for key in ("projects", "data", "results", "items"):
+                if inner.get(key):
+                    return inner[key], prefix + (key,)
+        if isinstance(inner, list) and inner:
+            return inner, prefix
+        if isinstance(data, dict):
+            # Last resort: find any list in the response
+            for k, v in data.items():
+                if isinstance(v, dict):
+                    for kk, vv in v.items():
+                        if isinstance(vv, list) and vv:
+                            return vv, (k, kk)
+                if isinstance(v, list) and v:
+                    return v, (k,)
+        return None, None
+
+    async def _lead_worker(self, queue, out):
+        """Drain *queue*, turning raw project dicts into leads on *out*."""
+        while True:
+            index, total, proj = await queue.get()
+            try:
+                lead = self._build_lead(proj, index, total)
+                if lead:
+                    await out.put(lead)
+            except Exception as e:
+                log_status(f"Failed to process project #{index + 1}: {e}")
+            finally:
+                queue.task_done()
+
+    def _build_lead(self, proj, index, total):
+        """Build a lead dict from one project list item (None = skip)."""
+        project_id = str(
+            proj.get("id")
+            or proj.get("project_id")
+            or proj.get("projectId")
+            or proj.get("_id")
+            or index
+        )
+        lead_id = f"planhub_{project_id}"
+        # Projects repeated across pages are dropped before any other work;
+        # they are counted and reported once at the end of the listing
+        if lead_id in self.processed_ids:
+            self._duplicates += 1
+            logger.debug("Skipping duplicate: %s", lead_id)
+            return None
+        self.processed_ids.add(lead_id)
+
+        project_name = (
+            proj.get("project_name")
+            or proj.get("name")
+            or proj.get("title")
+            or "Unknown"
+        )
+
+        # Quick past-due check from list data
+        bid_date_str = self._bid_date(proj)
+        if bid_date_str and self._is_past_due(bid_date_str):
+            log_status(f"Skipping past-due: {project_name[:40]}")
+            return None
 
-            self.leads.append(lead)
-            log_status(f"  -> {name[:40]} | {gc_company} | {location} | bid {bid_date}")
+        # Unchanged since the last run: reuse that lead (and its file links)
+        fingerprint = self._fingerprint(proj)
+        self._fingerprints[lead_id] = fingerprint
+        cached = self._cache.get(lead_id)
+        if cached and cached[0] == fingerprint:
+            log_status(f"[{index+1}/{total or '?'}] Unchanged: {project_name[:50]}")
+            return self._restore_cached_lead(_json_loads(cached[1]))
 
-        log_status(f"SCRAPING COMPLETE - Total leads: {len(self.leads)}")
-        return self.leads
+        log_status(f"[{index+1}/{total or '?'}] Processing: {project_name[:50]}")
+        return self._lead_from_project(proj, lead_id, project_id, project_name, bid_date_str)
+
+    def _lead_from_project(self, proj, lead_id, project_id, project_name, bid_date_str):
+        """Turn one project list item into a lead dict.
+
+        The transform behind _build_lead(), without its duplicate, past-due
+        and cache checks, so it can be timed or called on its own.
+        """
+        # --- Extract all data from the project list item directly ---
+        # (Per-project enrichment endpoints return 404, but the list has everything)
+        fields = self._extract(proj, self._PROJECT_FIELDS)
+        name = fields["name"] or project_name
+        description = fields["description"]
+        city = fields["city"]
+        state = fields["state"]
+        zip_code = fields["zip"]
+        bid_date = fields["bid_date"] or bid_date_str or "N/A"
+        project_value = fields["value"]
+        project_url = fields["url"]
+        construction_type = fields["construction_type"]
+        building_use = fields["building_use"]
+
+        # Most projects carry city, state and zip; format those directly and
+        # only filter the parts when something is missing
+        if city and state:
+            location = f"{city}, {state}"
+            full_address = f"{location}, {zip_code}" if zip_code else location
+        else:
+            location = city or state or "N/A"
+            parts = [p for p in (city, state, zip_code) if p]
+            full_address = ", ".join(parts) if parts else location
+
+        # Sprinkler check
+        # Lowercase the searchable text once; the matcher works on the copy
+        search_text = f"{name}\n{description}".lower()
+        sprinklered = self._check_sprinkler(search_text)
+
+        # GC info — extract from general_contractors array in the list item
+        gc_company = "N/A"
+        contact_name = "N/A"
+        contact_phone = ""
+        contact_email = ""
+        planhub_gcs = []
+        gc_list = proj.get("general_contractors") or []
+        if isinstance(gc_list, list) and gc_list:
+            gc = self._extract(gc_list[0], self._GC_CONTACT_FIELDS)
+            gc_company = gc["company"]
+            contact_name = gc["contact_name"]
+            contact_phone = gc["contact_phone"]
+            contact_email = gc["contact_email"]
+            # Store all GCs for display in the details panel
+            if len(gc_list) > 1:
+                planhub_gcs = [self._extract(g, self._GC_ENTRY_FIELDS) for g in gc_list]
+
+        # Build URL
+        if not project_url:
+            project_url = f"https://supplier.planhub.com/project/{project_id}"
+
+        # Build type string from construction_types + building_use
+        type_parts = [p for p in [construction_type, building_use] if p]
+        project_type = " / ".join(type_parts) if type_parts else ""
+
+        # City/state/GC/type/date values repeat across many projects;
+        # interning them keeps one string per distinct value instead of one
+        # per lead.
+        intern = self._intern
+        city, state, location = intern(city), intern(state), intern(location)
+        gc_company, project_type = intern(gc_company), intern(project_type)
+        bid_date = intern(bid_date)
+        for gc in planhub_gcs:
+            gc["company_name"] = intern(gc["company_name"])
+
+        # Fallback city/state come from splitting the location once
+        loc_city, sep, loc_state = location.partition(",")
+
+        lead = {
+            "id": lead_id,
+            "name": name,
+            "gc": gc_company,
+            "company": gc_company,
+            "contact_name": contact_name,
+            "contact_phone": contact_phone,
+            "contact_email": contact_email,
+            "bid_date": bid_date,
+            "due_date": bid_date,
+            "site": "PlanHub",
+            "source": "PlanHub",
+            "sprinklered": sprinklered,
+            "location": location,
+            "city": city or loc_city.strip(),
+            "state": state or (loc_state.strip() if sep else "N/A"),
+            "trade": self._trade,
+            "description": description,
+            "full_address": full_address,
+            "url": project_url,
+            "value": project_value,
+            "project_type": project_type,
+            "extracted_at": self._extracted_at,
+            "files_link": None,
+            "download_link": None,
+            "local_file_path": None,
+            "planhub_gcs": planhub_gcs,
+        }
+
+        # Per-lead detail is debug-only; the "[i/N] Processing" line above
+        # already tracks progress in the dashboard log
+        logger.debug("  -> %.40s | %s | %s | bid %s", name, gc_company, location, bid_date)
+        return lead
 
     # -- save results --------------------------------------------------------
 
     async def save_results(self, output_file=None):
-        """Save leads to JSON file (same pattern as DOM version)."""
-        output_file = output_file or self.config.DB_FILE
+        """Save leads to JSON file (same pattern as DOM version).
+
+        The load/merge/dump runs in a worker thread so a large database
+        doesn't stall the event loop.  Leads are passed as shallow copies
+        so downloads can keep adding file links while the thread writes.
 
-        existing_leads = []
-        if os.path.exists(output_file):
+        Each checkpoint only carries the leads built or changed since the
+        previous one; earlier leads are already in the database and cache.
+        The dirty set is swapped out together with the lead snapshot, so a
+        lead changed while the thread writes is picked up next time, and it
+        is put back if the write fails.
+        """
+        output_file = output_file or self.config.DB_FILE
+        done = self._checkpointed
+        dirty, self._dirty_ids = self._dirty_ids, set()
+        leads = [
+            dict(lead) for lead in self.leads
+            if lead["id"] not in done or lead["id"] in dirty
+        ]
+        try:
+            await asyncio.to_thread(self._write_results, output_file, leads, dirty)
+        except BaseException:
+            self._dirty_ids |= dirty
+            raise
+        await asyncio.to_thread(self._write_cache, leads)
+        done.update(lead["id"] for lead in leads)
+
+    def _load_db(self, output_file):
+        """The database as a list, reusing the copy from our last save.
+
+        The file is only read and parsed again if something else (storage,
+        another scraper) has written it since.  A file that exists but
+        doesn't parse raises ValueError rather than reading as empty, so a
+        save never replaces a damaged database with just its own leads.
+        """
+        try:
+            f = open(output_file, "rb")
+        except FileNotFoundError:
+            self._db, self._db_stat = [], None
+            return self._db
+        with f:
+            # fstat on the open handle: the stat we cache is the one for
+            # the bytes we read, even if the file is replaced meanwhile
+            st = os.fstat(f.fileno())
+            stat = (st.st_mtime_ns, st.st_size)
+            if self._db is not None and self._db_stat == stat:
+                return self._db
+            raw = f.read()
+        if not raw.strip():
+            self._db = []
+        else:
             try:
-                with open(output_file, "r") as f:
-                    existing_leads = json.load(f)
-            except Exception:
-                existing_leads = []
+                self._db = _json_loads(raw)
+            except Exception as e:
+                self._db, self._db_stat = None, None
+                raise ValueError(f"{output_file} is not valid JSON, leaving it untouched: {e}") from e
+        self._db_stat = stat
+        return self._db
 
-        existing_ids = {lead.get("id") for lead in existing_leads}
-        new_leads = [lead for lead in self.leads if lead.get("id") not in existing_ids]
+    def _load_ids(self, output_file):
+        """Ids of the leads in *output_file*, without parsing it if possible.
 
-        all_leads = existing_leads + new_leads
+        The "<output_file>.ids" sidecar (one id per line) is trusted when it
+        was written no earlier than the database itself; otherwise the ids
+        are taken from the database and the sidecar is rebuilt.
+        """
+        try:
+            st = os.stat(output_file)
+        except FileNotFoundError:
+            return set()
+        stat = (st.st_mtime_ns, st.st_size)
+        if self._db_ids is not None and self._db_ids_stat == stat:
+            return self._db_ids
+        ids_file = f"{output_file}.ids"
+        try:
+            if os.stat(ids_file).st_mtime_ns >= st.st_mtime_ns:
+                with open(ids_file, encoding="utf-8") as f:
+                    self._db_ids = set(f.read().splitlines())
+                self._db_ids_stat = stat
+                return self._db_ids
+        except OSError:
+            pass
+        ids = {lead.get("id") for lead in self._load_db(output_file)}
+        self._store_ids(output_file, ids, self._db_stat)
+        return ids
 
-        with open(output_file, "w") as f:
-            json.dump(all_leads, f, indent=2)
+    def _store_ids(self, output_file, ids, db_stat, append=False):
+        """Record *ids* in the sidecar: appended, or replacing its contents.
+
+        *db_stat* is the database's (mtime, size) that the ids describe.
+        """
+        self._db_ids_stat = db_stat
+        if append and not ids:
+            return
+        lines = "".join(f"{i}\n" for i in ids if isinstance(i, str))
+        ids_file = f"{output_file}.ids"
+        try:
+            if append:
+                with open(ids_file, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            else:
+                # A torn index would look current yet miss ids
+                _write_atomic(ids_file, lines.encode("utf-8"))
+        except OSError as e:
+            log_status(f"Could not update id index: {e}")
+        if append and self._db_ids is not None:
+            self._db_ids |= set(ids)
+        elif not append:
+            self._db_ids = set(ids)
+
+    def _write_results(self, output_file, leads, dirty):
+        """Merge *leads* into *output_file* (blocking).
+
+        New leads are appended in place; the whole file is only rewritten
+        (and only then parsed) when a lead saved earlier this run is in
+        *dirty*, the ids changed since the last checkpoint.
+        """
+        existing_ids = self._load_ids(output_file)
+        new_leads = [lead for lead in leads if lead.get("id") not in existing_ids]
+
+        # Leads this run added at an earlier checkpoint are refreshed if
+        # they changed since (e.g. gained file links); anything else already
+        # in the database is left untouched.
+        stale = dirty & self._saved_ids
+
+        db_in_sync = self._db is not None and self._db_stat == self._db_ids_stat
+        appended = None if stale else self._append_json_array(output_file, new_leads)
+        if appended is None:
+            existing_leads = self._load_db(output_file)
+            if stale:
+                current = {lead.get("id"): lead for lead in leads}
+                existing_leads = [
+                    current.get(lead.get("id"), lead) if lead.get("id") in stale else lead
+                    for lead in existing_leads
+                ]
+            # Built as a new list: the cached copy must keep matching the
+            # file on disk if the write below fails
+            existing_leads = existing_leads + new_leads
+            # Serialized up front and swapped in whole, so a crash mid-save
+            # can't leave a truncated database for the next run to discard
+            st = _write_atomic(output_file, _json_dumps_leads(existing_leads))
+            self._db = existing_leads
+            self._db_stat = (st.st_mtime_ns, st.st_size)
+            self._store_ids(
+                output_file, [lead.get("id") for lead in existing_leads], self._db_stat
+            )
+        else:
+            # Keep the parsed copy (if any) in step with the appended file
+            if db_in_sync:
+                self._db.extend(new_leads)
+                self._db_stat = appended
+            self._store_ids(
+                output_file, [lead.get("id") for lead in new_leads], appended, append=True
+            )
+        self._saved_ids |= {lead.get("id") for lead in new_leads}
 
         log_status(f"Saved {len(new_leads)} new leads to {output_file}")
-        log_status(f"Total leads in database: {len(all_leads)}")
+        log_status(f"Total leads in database: {len(self._db_ids)}")
+
+    @staticmethod
+    def _append_json_array(path, items):
+        """Append *items* to the JSON array in *path* without rewriting it.
+
+        Only the tail of the file is touched: the closing bracket is
+        overwritten with the new elements.  Returns the file's
+        ``(mtime_ns, size)`` afterwards, or None (file untouched) if the
+        file is missing or doesn't end like a JSON array.  If the write
+        fails part way, the original tail is put back before returning
+        None; if even that fails, the OSError is raised so the caller
+        doesn't rewrite the database from a torn file.
+        """
+        try:
+            f = open(path, "r+b")
+        except OSError:
+            return None
+        with f:
+            try:
+                if not items:
+                    st = os.fstat(f.fileno())
+                    return (st.st_mtime_ns, st.st_size)
+                end = f.seek(0, os.SEEK_END)
+                f.seek(max(0, end - 64))
+                tail = f.read()
+            except OSError:
+                return None
+            stripped = tail.rstrip()
+            if not stripped.endswith(b"]"):
+                return None
+            before = stripped[:-1].rstrip()
+            if not before:
+                return None  # tail too short to tell; let caller rewrite
+            # json.dumps(..., indent=2) of the list, minus its brackets,
+            # is already indented as array elements
+            body = _json_dumps_leads(items)[2:-2]
+            sep = b"\n" if before.endswith(b"[") else b",\n"
+            tail_at = end - len(tail)
+            try:
+                f.seek(tail_at + len(before))
+                f.write(sep + body + b"\n]")
+                f.truncate()
+                f.flush()
+                st = os.fstat(f.fileno())
+            except OSError:
+                # Cut back to where the old tail began (freeing the space
+                # just taken) and write that tail again; an error here
+                # propagates
+                f.truncate(tail_at)
+                f.seek(tail_at)
+                f.write(tail)
+                f.flush()
+                return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _request_save(self):
+        """Ask the checkpoint writer to persist the current leads (no-op outside run())."""
+        if self._save_queue is not None:
+            self._save_queue.put_nowait(True)
+
+    async def _save_worker(self, queue):
+        """Single writer for checkpoint saves; a None item means final save and exit."""
+        while True:
+            final = await queue.get() is None
+            # Collapse requests that piled up during the last write
+            while not queue.empty():
+                final = queue.get_nowait() is None or final
+            await self._run_phase("Save", self.save_results())
+            if final:
+                return
 
     # -- public entry point --------------------------------------------------
 
@@ -1479,19 +2483,64 @@ class PlanHubScraper:
             max_projects: Max number of projects to scrape (None = all).
             download_files: Whether to download project files via browser.
         """
+        self._save_queue = asyncio.Queue()
+        writer = asyncio.create_task(self._save_worker(self._save_queue))
         try:
-            await self._api.open()
-            await self.scrape_all_projects(max_projects)
-            if download_files and self.leads:
-                await self.download_project_files(self.leads)
-            await self.save_results()
-            return self.leads
-        except Exception as e:
-            log_status(f"Fatal error: {e}")
-            traceback.print_exc()
+            await self._api.open()  # auth proceeds in the background
+            await asyncio.gather(asyncio.to_thread(self._load_cache), self._resolve_gdrive())
+            # Each phase is isolated: a failed download pass must not throw
+            # away the leads the scrape already collected.
+            if download_files:
+                ok = await self._run_phase("Scrape/download", self._scrape_and_download(max_projects))
+            else:
+                ok = await self._run_phase("Scrape", self.scrape_all_projects(max_projects))
+            self._save_queue.put_nowait(None)
+            await writer
+            # Only a full pass knows which cached projects left the list; a
+            # run that lost auth or a page returns normally but saw only part
+            if ok and not max_projects and self._list_complete:
+                await asyncio.to_thread(self._prune_cache)
             return self.leads
         finally:
+            if not writer.done():
+                writer.cancel()
+            self._save_queue = None
             await self._api.close()
+            flush_logs()
+
+    async def _scrape_and_download(self, max_projects):
+        """Scrape and download as one pipeline.
+
+        Each lead is handed to the download worker as soon as it is built,
+        so browser start-up and the first downloads overlap with paging
+        the rest of the project list.
+        """
+        queue = asyncio.Queue()
+        downloader = asyncio.create_task(self._download_worker(queue))
+        try:
+            async for lead in self.iter_leads(max_projects):
+                self.leads.append(lead)
+                queue.put_nowait(lead)
+            log_status(f"SCRAPING COMPLETE - Total leads: {len(self.leads)}")
+            # Checkpoint now so a crash in the browser pass still leaves
+            # the scraped leads on disk.
+            self._request_save()
+        except asyncio.CancelledError:
+            downloader.cancel()
+            raise
+        finally:
+            queue.put_nowait(None)
+            await asyncio.gather(downloader, return_exceptions=True)
+
+    async def _run_phase(self, label, coro):
+        """Await one stage of run(), logging (not raising) any failure."""
+        try:
+            await coro
+            return True
+        except Exception as e:
+            log_status(f"{label} failed: {e}")
+            logger.exception("PlanHub %s phase failed", label)
+            return False
 
 
 # ---------------------------------------------------------------------------
@@ -1510,14 +2559,19 @@ async def main():
     print("=" * 60)
 
     if leads:
-        for i, lead in enumerate(leads, 1):
-            print(f"\nLead {i}:")
-            print(f"  Name: {lead.get('name', 'N/A')}")
-            print(f"  GC: {lead.get('gc', 'N/A')}")
-            print(f"  Bid Date: {lead.get('bid_date', 'N/A')}")
-            print(f"  Location: {lead.get('location', 'N/A')}")
-            print(f"  Sprinklered: {lead.get('sprinklered', False)}")
-            print(f"  Files: {lead.get('download_link', 'None')}")
+        # Per-lead report is a dev aid; `python -O` compiles it out
+        if __debug__:
+            # One write for the whole report instead of seven prints per lead
+            sys.stdout.write("".join(
+                f"\nLead {i}:\n"
+                f"  Name: {lead.get('name', 'N/A')}\n"
+                f"  GC: {lead.get('gc', 'N/A')}\n"
+                f"  Bid Date: {lead.get('bid_date', 'N/A')}\n"
+                f"  Location: {lead.get('location', 'N/A')}\n"
+                f"  Sprinklered: {lead.get('sprinklered', False)}\n"
+                f"  Files: {lead.get('download_link', 'None')}\n"
+                for i, lead in enumerate(leads, 1)
+            ))
     else:
         print("\n No leads found. Check the debug output above.")
         if not PLANHUB_DEBUG:
@@ -1527,4 +2581,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop's libuv-based loop is faster for socket-heavy runs; optional
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -2,59 +2,428 @@
 PlanHub scraper using Playwright for reliable browser automation.
 """
 import os
+import re
 import sys
 import json
+import time
+import hashlib
+import copy
 import asyncio
+import logging
 import platform
+import functools
+import traceback
+from collections import deque
 from datetime import datetime, date
+from urllib.parse import urlparse
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import PlanHubConfig, DATE_FORMATS
 
-# Import Gemini browser helper
+# orjson is optional; it parses and pretty-prints the leads DB several
+# times faster than the stdlib
 try:
-    from scrapers.gemini_browser import GeminiBrowser, GEMINI_AVAILABLE
-    print(f"[PH] Gemini browser module loaded. Available: {GEMINI_AVAILABLE}")
-except ImportError as e:
-    GEMINI_AVAILABLE = False
-    GeminiBrowser = None
-    print(f"[PH] Gemini browser NOT available: {e}")
-
-# Import Google Drive service
-try:
-    from services.google_drive import upload_and_cleanup, should_use_gdrive, is_authenticated, get_status, check_file_exists
-    GDRIVE_AVAILABLE = True
-    print(f"[PH] Google Drive module loaded. Available: {GDRIVE_AVAILABLE}")
-except ImportError as e:
-    GDRIVE_AVAILABLE = False
-    print(f"[PH] Google Drive module NOT available: {e}")
+    import orjson
+except ImportError:
+    orjson = None
+
+# The Gemini browser helper and Google Drive service pull in their SDKs, so
+# they are imported the first time a scrape needs them rather than whenever
+# this module is imported. None = not tried yet, False = unavailable.
+_gemini_browser_cls = None
+_gdrive = None
+
+
+def _load_gemini():
+    """Return the GeminiBrowser class, or None if Gemini is unavailable."""
+    global _gemini_browser_cls
+    if _gemini_browser_cls is None:
+        try:
+            from scrapers.gemini_browser import GeminiBrowser, GEMINI_AVAILABLE
+            print(f"[PH] Gemini browser module loaded. Available: {GEMINI_AVAILABLE}")
+            _gemini_browser_cls = GeminiBrowser if GEMINI_AVAILABLE and GeminiBrowser else False
+        except ImportError as e:
+            _gemini_browser_cls = False
+            print(f"[PH] Gemini browser NOT available: {e}")
+    return _gemini_browser_cls or None
+
+
+def _load_gdrive():
+    """Return the services.google_drive module, or None if it can't load."""
+    global _gdrive
+    if _gdrive is None:
+        try:
+            from services import google_drive
+            _gdrive = google_drive
+            print("[PH] Google Drive module loaded. Available: True")
+        except ImportError as e:
+            _gdrive = False
+            print(f"[PH] Google Drive module NOT available: {e}")
+    return _gdrive or None
+
+
+# Reads one project-table row inside the page: for each field, the first
+# selector whose element has non-blank text (same precedence the per-field
+# locator loops used), plus the whole row's text for the sprinkler check.
+_ROW_FIELDS_JS = """(row) => {
+    const pick = (selectors) => {
+        for (const sel of selectors) {
+            const el = row.querySelector(sel);
+            const text = el && el.textContent.trim();
+            if (text) return text;
+        }
+        return 'N/A';
+    };
+    return {
+        name: pick([
+            'td.mat-column-project_name div span',
+            'td.mat-column-project_name span',
+            'td.cdk-column-project_name span',
+        ]),
+        bid_date: pick(['td.mat-column-bid_due_date', 'td.cdk-column-bid_due_date']),
+        location: pick([
+            'td.mat-column-location span',
+            'td.cdk-column-location span',
+            'td.mat-column-location',
+        ]),
+        text: row.textContent || '',
+    };
+}"""
+
+# The same extraction over every row a locator matches, for evaluate_all()
+_ALL_ROWS_FIELDS_JS = f"(rows) => rows.map((row) => ({_ROW_FIELDS_JS})(row))"
+
+# Fallback row click: finds the first table row whose text contains the
+# project name (passed as the argument) and clicks its name cell.
+_ROW_CLICK_JS = """(name) => {
+    const rows = document.querySelectorAll('planhub-project-table tbody tr');
+    for (const row of rows) {
+        if (row.textContent.includes(name)) {
+            const nameCell = row.querySelector('td.mat-column-project_name') || row.querySelector('td:first-child');
+            if (nameCell) nameCell.click();
+            else row.click();
+            return true;
+        }
+    }
+    return false;
+}"""
+
+# First /project/<id> link (or routerLink) on the page other than the list.
+_EXTRACT_PROJECT_URL_JS = """() => {
+    const allLinks = document.querySelectorAll('a');
+    for (const link of allLinks) {
+        const href = link.getAttribute('href') || '';
+        const fullHref = link.href || '';
+        const match = href.match(/\\/project\\/([a-zA-Z0-9_-]+)/) ||
+                      fullHref.match(/\\/project\\/([a-zA-Z0-9_-]+)/);
+        if (match && match[1] !== 'list') {
+            return fullHref || href;
+        }
+    }
+    const routerEls = document.querySelectorAll('[routerLink]');
+    for (const el of routerEls) {
+        const rl = el.getAttribute('routerLink') || '';
+        const match = rl.match(/\\/project\\/([a-zA-Z0-9_-]+)/);
+        if (match && match[1] !== 'list') {
+            return rl;
+        }
+    }
+    return null;
+}"""
+
+# The scraper reads table text and downloads files; none of these are needed.
+# Stylesheets stay: clicks, the modal backdrop and Gemini's screenshots need
+# the real layout. "other" stays too, since file downloads can arrive as it.
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "font", "media", "ping"))
+# Analytics/ads domains; a request is blocked when its host is one of these
+# or a subdomain of one, so paths or query strings that merely mention them
+# are left alone.
+_ANALYTICS_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "googleadservices.com",
+    "doubleclick.net", "googlesyndication.com", "facebook.net", "facebook.com",
+    "hotjar.com", "hotjar.io", "sentry.io", "segment.io", "segment.com",
+    "mixpanel.com", "amplitude.com", "intercom.io", "intercomcdn.com",
+    "fullstory.com",
+)
+
+
+def _is_analytics_host(url):
+    host = urlparse(url).hostname or ""
+    return any(host == h or host.endswith("." + h) for h in _ANALYTICS_HOSTS)
+
+
+async def _block_heavy_resources(route):
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _is_analytics_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Trimmed text of the first selector (in order) whose element has any, or
+# null: a selector probe list in one round trip instead of count() +
+# text_content() per entry.
+_FIRST_TEXT_JS = """(selectors) => {
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        const text = el && el.textContent.trim();
+        if (text) return text;
+    }
+    return null;
+}"""
+
+# Clicks the element of the first selector (in order) that matches anything
+# and returns that selector, or null if none matched.
+_CLICK_FIRST_JS = """(selectors) => {
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        if (el) {
+            el.click();
+            return sel;
+        }
+    }
+    return null;
+}"""
+
+# Description fallback: the long (> 50 chars) .description blocks inside the
+# overview's .wrapper / .project-details sections, joined in page order.
+# One TreeWalker pass over the overview rather than a .description query
+# per section (which also counted nested sections' blocks twice).
+_OVERVIEW_DESCRIPTION_JS = """() => {
+    const overview = document.querySelector('app-project-details-overview');
+    if (!overview) return null;
+    const walker = document.createTreeWalker(overview, NodeFilter.SHOW_ELEMENT, {
+        acceptNode: (node) => {
+            if (!node.classList.contains('description')) return NodeFilter.FILTER_SKIP;
+            const section = node.parentElement && node.parentElement.closest('.wrapper, .project-details');
+            return section && overview.contains(section) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+        },
+    });
+    let text = '';
+    let node;
+    while ((node = walker.nextNode())) {
+        if (node.textContent.length > 50) {
+            text += node.textContent.trim() + ' ';
+        }
+    }
+    return text.trim() || null;
+}"""
+
+# Reads the GC contact off the General Contractors tab in one go: given all
+# GC cards, picks the preferred (starred) one or else the first, and returns
+# {company, contact, phone, email} (null for a missing field), or null when
+# there are no cards. The regexes are built once up front.
+_GC_CARD_JS = """(cards) => {
+    if (!cards.length) return null;
+    const PHONE_TEXT_RE = /[\\d\\-\\(\\)\\s]{10,}/;
+    const PHONE_RE = /\\(?\\d{3}\\)?[\\s\\-]?\\d{3}[\\s\\-]?\\d{4}/;
+    const EMAIL_RE = /[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}/;
+    const card = cards.find((c) => {
+        const badge = c.querySelector('mat-icon');
+        return badge && (badge.textContent.includes('star') || c.textContent.includes('Preferred'));
+    }) || cards[0];
+
+    const company = () => {
+        const nameEl = card.querySelector('.company-name') ||
+                       card.querySelector('mat-card-title') ||
+                       card.querySelector('.name');
+        if (nameEl && nameEl.textContent.trim()) return nameEl.textContent.trim();
+        const bolds = card.querySelectorAll('strong, b, .bold');
+        for (const b of bolds) {
+            if (b.textContent.length > 3) return b.textContent.trim();
+        }
+        return null;
+    };
+
+    const contact = () => {
+        const content = card.querySelector('mat-card-content');
+        if (!content) return null;
+        const divs = content.querySelectorAll('div.content > div');
+        for (const div of divs) {
+            const icon = div.querySelector('mat-icon');
+            if (icon && (icon.textContent.includes('person') || icon.textContent.includes('account'))) {
+                const text = div.textContent.replace(icon.textContent, '').trim();
+                if (text) return text;
+            }
+        }
+        if (divs.length >= 2) {
+            return divs[1].textContent.trim();
+        }
+        return null;
+    };
+
+    const phone = () => {
+        const anchors = card.querySelectorAll('planhub-anchor a, a[href^="tel:"]');
+        for (const a of anchors) {
+            const href = a.getAttribute('href') || '';
+            if (href.startsWith('tel:')) {
+                return href.replace('tel:', '').trim();
+            }
+            const text = a.textContent.trim();
+            if (PHONE_TEXT_RE.test(text)) {
+                return text;
+            }
+        }
+        const phoneMatch = card.textContent.match(PHONE_RE);
+        return phoneMatch ? phoneMatch[0] : null;
+    };
+
+    const email = () => {
+        const anchors = card.querySelectorAll('planhub-anchor a, a[href^="mailto:"]');
+        for (const a of anchors) {
+            const href = a.getAttribute('href') || '';
+            if (href.startsWith('mailto:')) {
+                return href.replace('mailto:', '').trim();
+            }
+            const text = a.textContent.trim();
+            if (text.includes('@')) {
+                return text;
+            }
+        }
+        const emailMatch = card.textContent.match(EMAIL_RE);
+        return emailMatch ? emailMatch[0] : null;
+    };
+
+    return {company: company(), contact: contact(), phone: phone(), email: email()};
+}"""
+
+# The project list re-renders from this endpoint whenever a filter changes
+_FILTERED_PROJECTS_URL = '**/get-filtered-projects**'
+
+
+def _is_details_url(url):
+    """True for a project details page (the list lives under /project/ too)."""
+    return '/project/' in url and '/list' not in url
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome_executable():
+    """Find Chrome executable on the system (looked up once per process)."""
+    system = platform.system()
+    possible_paths = []
+
+    if system == 'Windows':
+        possible_paths = [
+            r'C:\Users\dms03\Development\planroom-genius\backend\chrome-win\chrome.exe',
+            r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+            os.path.expanduser(r'~\AppData\Local\Google\Chrome\Application\chrome.exe'),
+        ]
+    elif system == 'Darwin':
+        possible_paths = [
+            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+        ]
+    elif system == 'Linux':
+        possible_paths = [
+            '/usr/bin/chromium-browser',
+            '/usr/bin/chromium',
+            '/usr/bin/google-chrome',
+            '/usr/bin/google-chrome-stable',
+            '/snap/bin/chromium',
+            '/usr/lib/chromium-browser/chromium-browser',
+            '/usr/lib/chromium/chromium',
+        ]
+
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+
+    return None
 
-# Global log buffer that scheduler can access
-_ph_log_buffer = []
+
+logger = logging.getLogger(__name__)
+
+# Global log buffer that scheduler can access; bounded so a long run that
+# nobody drains can't grow it without limit (oldest lines drop first)
+_ph_log_buffer = deque(maxlen=10_000)
 
 
 def get_ph_logs():
     """Get and clear the log buffer."""
-    global _ph_log_buffer
-    logs = _ph_log_buffer.copy()
-    _ph_log_buffer = []
+    logs = list(_ph_log_buffer)
+    _ph_log_buffer.clear()
     return logs
 
 
+_LOG_FLUSH_INTERVAL = 0.1
+_last_log_flush = 0.0
+
+# Scheduler's add_to_log, resolved on first use (None when the scheduler
+# can't be imported, e.g. when this module runs standalone)
+_MISSING = object()
+_add_to_log_fn = _MISSING
+
+
 def log_status(msg):
-    """Log to both console and web UI."""
-    global _ph_log_buffer
-    print(f"[PH] {msg}", flush=True)
-    _ph_log_buffer.append(f"[PH] {msg}")
+    """Log to both console and web UI.
+
+    As in the API scraper, the console line goes through the module logger
+    when logging is configured; otherwise it is written to stdout and
+    flushed at most every _LOG_FLUSH_INTERVAL seconds rather than per line
+    (run() flushes whatever is left).
+    """
+    global _add_to_log_fn, _last_log_flush
+    line = f"[PH] {msg}"
+    _ph_log_buffer.append(line)
+    if logger.hasHandlers():
+        logger.info("%s", msg)
+    else:
+        sys.stdout.write(line + "\n")
+        now = time.monotonic()
+        if now - _last_log_flush >= _LOG_FLUSH_INTERVAL:
+            _last_log_flush = now
+            sys.stdout.flush()
 
     # Also try to add to scheduler's log
-    try:
-        from services.scheduler import add_to_log
-        add_to_log(f"[PH] {msg}")
-    except:
-        pass
+    if _add_to_log_fn is _MISSING:
+        try:
+            from services.scheduler import add_to_log as _add_to_log_fn
+        except Exception:
+            _add_to_log_fn = None
+    if _add_to_log_fn:
+        try:
+            _add_to_log_fn(line)
+        except Exception:
+            pass
+
+
+def _dumps_leads(leads):
+    """Serialize leads as indented JSON bytes, matching json.dump(indent=2).
+
+    orjson writes non-ASCII characters raw, while other readers of the DB
+    open it with the platform's default encoding, so its output is only
+    used when it came out pure ASCII. OPT_NON_STR_KEYS lets it accept the
+    same int/float/bool keys json.dumps stringifies.
+    """
+    if orjson is not None:
+        data = orjson.dumps(leads, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        if data.isascii():
+            return data
+    return json.dumps(leads, indent=2).encode()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str):
+    """Parse a stripped date string with DATE_FORMATS, or None.
+
+    Memoized: the same handful of bid dates repeat down the project table
+    and across scrape cycles.
+    """
+    # The project grid renders bid dates as MM/DD/YYYY; build those
+    # directly and only walk the strptime formats for anything else
+    if (len(date_str) == 10 and date_str[2] == '/' and date_str[5] == '/' and date_str.isascii()
+            and date_str[:2].isdigit() and date_str[3:5].isdigit() and date_str[6:].isdigit()):
+        try:
+            return date(int(date_str[6:]), int(date_str[:2]), int(date_str[3:5]))
+        except ValueError:
+            return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
 
 
 class PlanHubScraper:
@@ -79,6 +448,17 @@ class PlanHubScraper:
         self.processed_ids = set()
         self.gemini_browser = None
         self.download_dir = self.config.DOWNLOAD_DIR
+        # filename -> Drive file info for the PlanHub folder, listed once per
+        # scrape (see _find_in_gdrive); None until the first lookup
+        self._gdrive_index = None
+
+        # One case-insensitive alternation scans row text once for every
+        # sprinkler keyword; the map recovers the configured spelling for logs
+        keywords = self.config.SPRINKLER_KEYWORDS
+        self._sprinkler_re = re.compile(
+            '|'.join(re.escape(k) for k in keywords) or r'(?!)', re.IGNORECASE
+        )
+        self._sprinkler_kw_lower = {k.lower(): k for k in keywords}
 
         # Use full desktop viewport for browsing
         self.config.VIEWPORT_WIDTH = 1920
@@ -87,37 +467,59 @@ class PlanHubScraper:
         # Ensure download directory exists
         os.makedirs(self.download_dir, exist_ok=True)
 
-    def _find_chrome_executable(self):
-        """Find Chrome executable on the system."""
-        system = platform.system()
-        possible_paths = []
-
-        if system == 'Windows':
-            possible_paths = [
-                r'C:\Users\dms03\Development\planroom-genius\backend\chrome-win\chrome.exe',
-                r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
-                os.path.expanduser(r'~\AppData\Local\Google\Chrome\Application\chrome.exe'),
-            ]
-        elif system == 'Darwin':
-            possible_paths = [
-                '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-            ]
-        elif system == 'Linux':
-            possible_paths = [
-                '/usr/bin/chromium-browser',
-                '/usr/bin/chromium',
-                '/usr/bin/google-chrome',
-                '/usr/bin/google-chrome-stable',
-                '/snap/bin/chromium',
-                '/usr/lib/chromium-browser/chromium-browser',
-                '/usr/lib/chromium/chromium',
-            ]
+        # id -> lead for leads whose Pass 2 finished but that aren't in the
+        # database yet, kept on disk so a run that dies before
+        # save_results() doesn't have to revisit and re-download them
+        self._processed_path = os.path.join(self.download_dir, '.processed_ids.json')
+        self._processed = self._load_processed()
 
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
+    def _load_processed(self):
+        """Read the Pass 2 checkpoint ({} if it's missing or unreadable)."""
+        try:
+            with open(self._processed_path, 'rb') as f:
+                raw = f.read()
+            processed = orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            return {}
+        return processed if isinstance(processed, dict) else {}
+
+    def _store_processed(self):
+        """Write the Pass 2 checkpoint (via a temp file so it's never torn)."""
+        tmp_path = self._processed_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps_leads(self._processed))
+            os.replace(tmp_path, self._processed_path)
+        except OSError as e:
+            print(f"[PH]    Could not save Pass 2 checkpoint: {e}")
+
+    def _clear_processed(self):
+        """Drop the Pass 2 checkpoint once its leads are in the database."""
+        if self._processed:
+            self._processed.clear()
+            try:
+                os.remove(self._processed_path)
+            except OSError:
+                pass
+
+    def _restore_processed(self, lead):
+        """Fill *lead* from the checkpoint if a previous run finished its Pass 2.
+
+        A lead whose files were kept locally only counts if the file is
+        still in the download folder.
+        """
+        done = self._processed.get(lead['id'])
+        if not done:
+            return False
+        local = done.get('local_file_path')
+        if local and not os.path.exists(os.path.join(self.download_dir, os.path.basename(local))):
+            return False
+        lead.update(done)
+        return True
 
-        return None
+    def _find_chrome_executable(self):
+        """Find Chrome executable on the system."""
+        return _find_chrome_executable()
 
     async def setup_browser(self):
         """Initialize Playwright browser with persistent profile."""
@@ -176,6 +578,10 @@ class PlanHubScraper:
                     raise
                 await asyncio.sleep(2)
 
+        # On the context rather than the page so the Pass 2 download tabs
+        # skip images, fonts and trackers too
+        await self.browser_context.route("**/*", _block_heavy_resources)
+
         # Use first page or create one
         if self.browser_context.pages:
             self.page = self.browser_context.pages[0]
@@ -203,14 +609,10 @@ class PlanHubScraper:
         if not date_str or date_str == "N/A":
             return None
 
-        for fmt in DATE_FORMATS:
-            try:
-                return datetime.strptime(date_str.strip(), fmt).date()
-            except ValueError:
-                continue
-
-        print(f"   Could not parse date: {date_str}")
-        return None
+        parsed = _parse_date_cached(date_str.strip())
+        if parsed is None:
+            print(f"   Could not parse date: {date_str}")
+        return parsed
 
     async def is_project_past_due(self, due_date_str):
         """Check if project is past due."""
@@ -233,35 +635,59 @@ class PlanHubScraper:
             print(f" Error checking due date: {e}")
             return False
 
+    def _load_existing_leads(self, output_file=None):
+        """Leads already in the JSON database ([] if it's missing or unreadable)."""
+        output_file = output_file or self.config.DB_FILE
+        if not os.path.exists(output_file):
+            return []
+        try:
+            with open(output_file, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except:
+            return []
+
     async def save_results(self, output_file=None):
         """Save leads to JSON file."""
         output_file = output_file or self.config.DB_FILE
 
-        existing_leads = []
-        if os.path.exists(output_file):
-            try:
-                with open(output_file, 'r') as f:
-                    existing_leads = json.load(f)
-            except:
-                existing_leads = []
+        existing_leads = self._load_existing_leads(output_file)
 
         existing_ids = {lead.get('id') for lead in existing_leads}
         new_leads = [lead for lead in self.leads if lead.get('id') not in existing_ids]
 
+        # Nothing new: leave the database as it is instead of rewriting it
+        if not new_leads and os.path.exists(output_file):
+            print(f"\n No new leads to save to {output_file}")
+            print(f" Total leads in database: {len(existing_leads)}")
+            self._clear_processed()
+            return
+
         all_leads = existing_leads + new_leads
 
-        with open(output_file, 'w') as f:
-            json.dump(all_leads, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_leads(all_leads))
 
         print(f"\n Saved {len(new_leads)} new leads to {output_file}")
         print(f" Total leads in database: {len(all_leads)}")
+        self._clear_processed()
 
-    async def navigate_with_retry(self, url, max_retries=3):
-        """Navigate to URL with retry logic."""
+    async def navigate_with_retry(self, url, max_retries=3, wait_selector=None):
+        """Navigate to URL with retry logic.
+
+        Waits for the DOM rather than for network idle (PlanHub's polling
+        and analytics can keep the network busy until the timeout), then,
+        if given, for *wait_selector* to show the page is usable.
+        """
         for attempt in range(max_retries):
             try:
                 print(f" Navigating to {url}{'...' if attempt == 0 else f' (retry {attempt})...'}")
-                await self.page.goto(url, wait_until='networkidle', timeout=self.config.NAVIGATION_TIMEOUT)
+                await self.page.goto(url, wait_until='domcontentloaded', timeout=self.config.NAVIGATION_TIMEOUT)
+                if wait_selector:
+                    try:
+                        await self.page.wait_for_selector(wait_selector, timeout=self.config.SELECTOR_TIMEOUT)
+                    except Exception:
+                        print(f" Still waiting on {wait_selector}, continuing anyway")
                 await asyncio.sleep(self.config.DELAY_AFTER_NAVIGATION)
                 print(" Navigation successful")
                 return True
@@ -299,7 +725,7 @@ class PlanHubScraper:
             print(" Missing login credentials (PLANHUB_LOGIN/PLANHUB_PW)")
             return False
 
-        if not await self.navigate_with_retry(self.config.LOGIN_URL):
+        if not await self.navigate_with_retry(self.config.LOGIN_URL, wait_selector=self.config.LOGIN_EMAIL_SELECTOR):
             return False
 
         try:
@@ -317,7 +743,10 @@ class PlanHubScraper:
             await self.page.click(self.config.LOGIN_SUBMIT_SELECTOR)
             print("   Submitted login form")
 
-            await asyncio.sleep(3)
+            try:
+                await self.page.wait_for_url(lambda url: 'signin' not in url, timeout=15000)
+            except Exception:
+                pass
 
             current_url = self.page.url
             if 'planhub.com' in current_url and 'signin' not in current_url:
@@ -329,7 +758,6 @@ class PlanHubScraper:
 
         except Exception as e:
             print(f" Login failed: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -337,7 +765,9 @@ class PlanHubScraper:
         """Navigate to project list page."""
         print("[PH] Navigating to project list...")
 
-        if not await self.navigate_with_retry(self.config.PROJECT_LIST_URL):
+        # The list may redirect to sign-in, so either page counts as loaded
+        list_ready = f"planhub-project-table, {self.config.LOGIN_EMAIL_SELECTOR}"
+        if not await self.navigate_with_retry(self.config.PROJECT_LIST_URL, wait_selector=list_ready):
             return False
 
         current_url = self.page.url
@@ -346,7 +776,7 @@ class PlanHubScraper:
         if not await self.check_login_status():
             if not await self.login():
                 return False
-            if not await self.navigate_with_retry(self.config.PROJECT_LIST_URL):
+            if not await self.navigate_with_retry(self.config.PROJECT_LIST_URL, wait_selector=list_ready):
                 return False
 
         return True
@@ -356,24 +786,27 @@ class PlanHubScraper:
         print("[PH] Loading saved search filter...")
 
         try:
-            await asyncio.sleep(2)
-
             # Click "View Saved Searches" button
             print("[PH]    Clicking 'View Saved Searches' button...")
             saved_searches_btn_selector = '#cdk-accordion-child-1 > div > div > planhub-persist-filters-actions > section > div > planhub-button:nth-child(4) > button'
+            filters_modal_selector = '#modal-content planhub-project-manage-filters-modal'
+
+            try:
+                await self.page.wait_for_selector(saved_searches_btn_selector, state='visible', timeout=self.config.SELECTOR_TIMEOUT)
+            except Exception:
+                pass
 
             try:
                 btn = self.page.locator(saved_searches_btn_selector)
                 if await btn.count() > 0:
                     await btn.click()
                     print("[PH]      Button clicked")
-                    await asyncio.sleep(1.5)
                 else:
                     print("[PH]      Button not found - trying by text...")
                     await self.page.get_by_role("button", name="Saved").or_(
                         self.page.get_by_role("button", name="View")
                     ).first.click()
-                    await asyncio.sleep(1.5)
+                await self.page.wait_for_selector(filters_modal_selector, state='visible', timeout=self.config.SELECTOR_TIMEOUT)
             except Exception as e:
                 print(f"[PH]      Could not click saved searches button: {e}")
                 return False
@@ -385,21 +818,21 @@ class PlanHubScraper:
             try:
                 cell = self.page.locator(daniels_filter_selector)
                 if await cell.count() > 0:
-                    await cell.click()
+                    await self._await_results(cell.click())
                     print("[PH]      Daniel's Filter selected")
-                    await asyncio.sleep(2)
 
                     # Click outside to close modal
                     await self.page.locator('body').click(position={'x': 0, 'y': 0})
-                    print("[PH]      Waiting for results to update...")
-                    await asyncio.sleep(3)
+                    try:
+                        await self.page.wait_for_selector(filters_modal_selector, state='hidden', timeout=self.config.SELECTOR_TIMEOUT)
+                    except Exception:
+                        pass
                 else:
                     print("[PH]      Daniel's Filter not found - trying by text...")
                     daniel_cell = self.page.locator('td').filter(has_text="Daniel")
                     if await daniel_cell.count() > 0:
-                        await daniel_cell.first.click()
+                        await self._await_results(daniel_cell.first.click())
                         print("[PH]      Found and clicked by text")
-                        await asyncio.sleep(3)
                     else:
                         print("[PH]      Could not find Daniel's Filter")
                         return False
@@ -412,10 +845,29 @@ class PlanHubScraper:
 
         except Exception as e:
             print(f"[PH] Error applying filters: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
+    async def _await_results(self, action):
+        """Run *action* (a click) and wait for the project list it refreshes.
+
+        Returns as soon as the filtered-projects response arrives instead of
+        sleeping for the slowest case; if no request shows up the list was
+        already current, so carry on.
+        """
+        print("[PH]      Waiting for results to update...")
+        try:
+            async with self.page.expect_response(_FILTERED_PROJECTS_URL, timeout=self.config.SELECTOR_TIMEOUT):
+                await action
+        except Exception as e:
+            if 'Timeout' not in type(e).__name__:
+                raise
+            return
+        try:
+            await self.page.wait_for_selector('planhub-project-table table tbody tr', state='visible', timeout=self.config.SELECTOR_TIMEOUT)
+        except Exception:
+            pass
+
     async def get_project_rows(self):
         """Get project rows from the table."""
         try:
@@ -450,118 +902,76 @@ class PlanHubScraper:
                 pass
             return None
 
-    async def check_sprinkler_keywords(self, text):
+    def check_sprinkler_keywords(self, text):
         """Check if text contains sprinkler-related keywords."""
         if not text:
             return False
 
-        text_lower = text.lower()
-        for keyword in self.config.SPRINKLER_KEYWORDS:
-            if keyword.lower() in text_lower:
-                print(f"     Found sprinkler keyword: '{keyword}'")
-                return True
-        return False
+        m = self._sprinkler_re.search(text)
+        if m is None:
+            return False
+        keyword = self._sprinkler_kw_lower.get(m.group(0).lower(), m.group(0))
+        print(f"     Found sprinkler keyword: '{keyword}'")
+        return True
 
     async def extract_project_details(self, row_locator, index):
         """Extract details from a project row using Playwright locators."""
         print(f"[PH]    Extracting project {index + 1}...")
 
         try:
-            project_name = "N/A"
-            bid_date = "N/A"
-            location = "N/A"
-
-            # Extract Project Name
-            name_selectors = [
-                'td.mat-column-project_name div span',
-                'td.mat-column-project_name span',
-                'td.cdk-column-project_name span',
-            ]
-            for selector in name_selectors:
-                try:
-                    name_loc = row_locator.locator(selector)
-                    if await name_loc.count() > 0:
-                        text = await name_loc.first.text_content()
-                        if text and text.strip():
-                            project_name = text.strip()
-                            break
-                except:
-                    continue
-
-            # Extract Bid Date
-            date_selectors = [
-                'td.mat-column-bid_due_date',
-                'td.cdk-column-bid_due_date',
-            ]
-            for selector in date_selectors:
-                try:
-                    date_loc = row_locator.locator(selector)
-                    if await date_loc.count() > 0:
-                        text = await date_loc.first.text_content()
-                        if text and text.strip():
-                            bid_date = text.strip()
-                            break
-                except:
-                    continue
-
-            # Extract Location
-            loc_selectors = [
-                'td.mat-column-location span',
-                'td.cdk-column-location span',
-                'td.mat-column-location',
-            ]
-            for selector in loc_selectors:
-                try:
-                    loc_loc = row_locator.locator(selector)
-                    if await loc_loc.count() > 0:
-                        text = await loc_loc.first.text_content()
-                        if text and text.strip():
-                            location = text.strip()
-                            break
-                except:
-                    continue
-
-            # Get full row text for sprinkler keyword check
-            row_text = await row_locator.text_content()
-            sprinklered = await self.check_sprinkler_keywords(row_text)
-
-            # Generate unique ID
-            project_id = f"planhub_{index}_{hash(project_name) % 10000}"
-
-            details = {
-                'id': project_id,
-                'name': project_name,
-                'gc': "N/A",
-                'company': "N/A",
-                'contact_name': "N/A",
-                'bid_date': bid_date,
-                'due_date': bid_date,
-                'site': 'PlanHub',
-                'source': 'PlanHub',
-                'sprinklered': sprinklered,
-                'location': location,
-                'city': location.split(',')[0].strip() if ',' in location else location,
-                'state': location.split(',')[1].strip() if ',' in location else "N/A",
-                'trade': self.config.TRADE_FILTER,
-                'url': self.config.PROJECT_LIST_URL,
-                'extracted_at': datetime.now().isoformat(),
-                'files_link': None,
-                'download_link': None,
-                'local_file_path': None,
-            }
-
-            print(f"[PH]      Name: {project_name[:40]}...")
-            print(f"[PH]      Bid Date: {bid_date}")
-            print(f"[PH]      Location: {location}")
-
-            return details
+            # All cells and the row text come back in one round-trip
+            fields = await row_locator.evaluate(_ROW_FIELDS_JS)
+            return await self._details_from_fields(fields, index)
 
         except Exception as e:
             print(f"[PH]      Error extracting details: {e}")
-            import traceback
             traceback.print_exc()
             return None
 
+    async def _details_from_fields(self, fields, index):
+        """Build a lead dict from the values _ROW_FIELDS_JS read out of a row."""
+        project_name = fields['name']
+        bid_date = fields['bid_date']
+        location = fields['location']
+        # "City, ST" - the state is the second comma field, as before
+        city, sep, rest = location.partition(',')
+
+        # Full row text for sprinkler keyword check
+        sprinklered = self.check_sprinkler_keywords(fields['text'])
+
+        # Stable ID from the name alone: hash() is salted per process and
+        # the row index shifts between scrapes, so neither dedupes reruns
+        name_digest = hashlib.blake2b(project_name.encode('utf-8'), digest_size=8).hexdigest()
+        project_id = f"planhub_{name_digest}"
+
+        details = {
+            'id': project_id,
+            'name': project_name,
+            'gc': "N/A",
+            'company': "N/A",
+            'contact_name': "N/A",
+            'bid_date': bid_date,
+            'due_date': bid_date,
+            'site': 'PlanHub',
+            'source': 'PlanHub',
+            'sprinklered': sprinklered,
+            'location': location,
+            'city': city.strip() if sep else location,
+            'state': rest.partition(',')[0].strip() if sep else "N/A",
+            'trade': self.config.TRADE_FILTER,
+            'url': self.config.PROJECT_LIST_URL,
+            'extracted_at': datetime.now().isoformat(),
+            'files_link': None,
+            'download_link': None,
+            'local_file_path': None,
+        }
+
+        print(f"[PH]      Name: {project_name[:40]}...")
+        print(f"[PH]      Bid Date: {bid_date}")
+        print(f"[PH]      Location: {location}")
+
+        return details
+
     async def _click_row_and_open_details(self, lead):
         """
         Click a project row and navigate to its details page.
@@ -591,113 +1001,50 @@ class PlanHubScraper:
 
         # Strategy 2: JS fallback
         if not row_clicked:
-            safe_name = project_name.replace('"', '\\"').replace("'", "\\'")
-            row_clicked = await self.page.evaluate(f'''() => {{
-                const rows = document.querySelectorAll('planhub-project-table tbody tr');
-                for (const row of rows) {{
-                    if (row.textContent.includes("{safe_name}")) {{
-                        const nameCell = row.querySelector('td.mat-column-project_name') || row.querySelector('td:first-child');
-                        if (nameCell) nameCell.click();
-                        else row.click();
-                        return true;
-                    }}
-                }}
-                return false;
-            }}''')
+            # Name goes in as an argument: no escaping, and the script text
+            # stays the same on every call
+            row_clicked = await self.page.evaluate(_ROW_CLICK_JS, project_name)
             if row_clicked:
                 print("[PH]    Clicked row via JS fallback")
             else:
                 print("[PH]    Could not find row to click")
                 return False
 
-        await asyncio.sleep(2)
-
-        # Check if we went straight to details (unlikely but check)
-        current_url = self.page.url
-        if '/project/' in current_url and '/list' not in current_url:
-            print("[PH]    Direct navigation to details page")
-            return True
-
         # Wait for quick view panel to appear
         print("[PH]    Waiting for quick view panel...")
         try:
             await self.page.locator('planhub-project-quick-view').wait_for(timeout=5000)
             print("[PH]    Quick view panel detected")
         except:
+            # Check if we went straight to details (unlikely but check)
+            if _is_details_url(self.page.url):
+                print("[PH]    Direct navigation to details page")
+                return True
             print("[PH]    Quick view panel not detected, continuing anyway...")
 
-        # Strategy A: Click "View Project Details" using the exact config CSS selector
-        try:
-            details_btn = self.page.locator(self.config.MORE_DETAILS_BTN_FULL)
-            if await details_btn.count() > 0:
-                await details_btn.click()
-                print("[PH]    Clicked 'More Details' button via config selector")
-                try:
-                    await self.page.wait_for_url('**/project/**', timeout=8000)
-                except:
-                    await asyncio.sleep(3)
-                current_url = self.page.url
-                if '/project/' in current_url and '/list' not in current_url:
-                    return True
-        except Exception as e:
-            print(f"[PH]    Config selector failed: {e}")
-
-        # Strategy B: Click the button scoped within the quick view panel
+        # Strategy A: Click "View Project Details" - the config CSS selector,
+        # the button inside the quick view panel, or any button with that
+        # name, whichever matches first
         try:
-            quick_view = self.page.locator('planhub-project-quick-view')
-            view_btn = quick_view.locator('button').filter(has_text='View Project Details')
-            if await view_btn.count() > 0:
-                await view_btn.first.click()
-                print("[PH]    Clicked 'View Project Details' via scoped panel locator")
-                try:
-                    await self.page.wait_for_url('**/project/**', timeout=8000)
-                except:
-                    await asyncio.sleep(3)
-                current_url = self.page.url
-                if '/project/' in current_url and '/list' not in current_url:
-                    return True
-        except Exception as e:
-            print(f"[PH]    Scoped panel locator failed: {e}")
-
-        # Strategy C: Click using broad Playwright text locator (get_by_role for precision)
-        try:
-            view_btn = self.page.get_by_role('button', name='View Project Details')
-            if await view_btn.count() > 0:
-                await view_btn.first.click()
-                print("[PH]    Clicked 'View Project Details' via role locator")
-                try:
-                    await self.page.wait_for_url('**/project/**', timeout=8000)
-                except:
-                    await asyncio.sleep(3)
-                current_url = self.page.url
-                if '/project/' in current_url and '/list' not in current_url:
-                    return True
+            details_btn = self.page.locator(self.config.MORE_DETAILS_BTN_FULL).or_(
+                self.page.locator('planhub-project-quick-view button').filter(has_text='View Project Details')
+            ).or_(
+                self.page.get_by_role('button', name='View Project Details')
+            )
+            await details_btn.first.click(timeout=5000)
+            print("[PH]    Clicked 'View Project Details' button")
+            try:
+                await self.page.wait_for_url(_is_details_url, timeout=8000)
+            except:
+                pass
+            if _is_details_url(self.page.url):
+                return True
         except Exception as e:
-            print(f"[PH]    Role locator failed: {e}")
+            print(f"[PH]    'View Project Details' click failed: {e}")
 
-        # Strategy D: Find project detail link via JS and navigate directly
+        # Strategy B: Find project detail link via JS and navigate directly
         try:
-            nav_result = await self.page.evaluate('''() => {
-                const allLinks = document.querySelectorAll('a');
-                for (const link of allLinks) {
-                    const href = link.getAttribute('href') || '';
-                    const fullHref = link.href || '';
-                    const match = href.match(/\\/project\\/([a-zA-Z0-9_-]+)/) ||
-                                  fullHref.match(/\\/project\\/([a-zA-Z0-9_-]+)/);
-                    if (match && match[1] !== 'list') {
-                        return fullHref || href;
-                    }
-                }
-                const routerEls = document.querySelectorAll('[routerLink]');
-                for (const el of routerEls) {
-                    const rl = el.getAttribute('routerLink') || '';
-                    const match = rl.match(/\\/project\\/([a-zA-Z0-9_-]+)/);
-                    if (match && match[1] !== 'list') {
-                        return rl;
-                    }
-                }
-                return null;
-            }''')
+            nav_result = await self.page.evaluate(_EXTRACT_PROJECT_URL_JS)
 
             if nav_result:
                 project_url = nav_result
@@ -705,22 +1052,22 @@ class PlanHubScraper:
                     project_url = f"https://supplier.planhub.com{project_url}"
                 print(f"[PH]    Navigating to extracted URL: {project_url}")
                 await self.page.goto(project_url, wait_until='domcontentloaded', timeout=30000)
-                await asyncio.sleep(3)
-                current_url = self.page.url
-                if '/project/' in current_url and '/list' not in current_url:
+                if _is_details_url(self.page.url):
                     return True
         except Exception as e:
             print(f"[PH]    JS URL extraction failed: {e}")
 
-        # Strategy E: Gemini vision as last resort
+        # Strategy C: Gemini vision as last resort
         if self.gemini_browser:
             print("[PH]    All strategies failed, trying Gemini vision...")
             await self.gemini_browser.find_and_click(
                 "the 'View Project Details' link or button in the quick view panel on the right side of the screen"
             )
-            await asyncio.sleep(3)
-            current_url = self.page.url
-            if '/project/' in current_url and '/list' not in current_url:
+            try:
+                await self.page.wait_for_url(_is_details_url, timeout=8000)
+            except:
+                pass
+            if _is_details_url(self.page.url):
                 return True
 
         print("[PH]    Could not navigate to project details page")
@@ -732,6 +1079,27 @@ class PlanHubScraper:
             pass
         return False
 
+    def _load_gdrive_index(self):
+        """List the PlanHub Drive folder once per scrape (False if that failed)."""
+        if self._gdrive_index is None:
+            self._gdrive_index = _load_gdrive().list_files(source='PlanHub')
+            if self._gdrive_index is None:
+                self._gdrive_index = False
+            else:
+                print(f"[PH]    Indexed {len(self._gdrive_index)} files in Drive")
+        return self._gdrive_index
+
+    def _find_in_gdrive(self, filename):
+        """Look *filename* up in the PlanHub Drive folder.
+
+        The folder is listed once and then searched locally; if listing
+        fails, each name falls back to its own check_file_exists() query.
+        """
+        index = self._load_gdrive_index()
+        if index is False:
+            return _load_gdrive().check_file_exists(filename, source='PlanHub')
+        return index.get(filename)
+
     async def download_files_for_lead(self, lead):
         """
         Click row to open details, extract full address, download files.
@@ -746,13 +1114,14 @@ class PlanHubScraper:
         print(f"\n[PH] [Pass 2] Processing: {lead['name'][:40]}...")
 
         # PRE-CHECK: Check if file already exists in Google Drive
-        if GDRIVE_AVAILABLE and should_use_gdrive():
+        gdrive = _load_gdrive()
+        if gdrive and gdrive.should_use_gdrive():
             try:
                 project_name_clean = "".join(c for c in lead['name'][:60] if c.isalnum() or c in ' -_').strip()
                 expected_filename = f"{project_name_clean}.zip"
 
                 print(f"[PH]    Checking for existing file in Drive: {expected_filename}...")
-                existing = check_file_exists(expected_filename, source='PlanHub')
+                existing = self._find_in_gdrive(expected_filename)
 
                 if existing:
                     print(f"[PH]    Found existing file in Drive! Skipping download.")
@@ -771,8 +1140,9 @@ class PlanHubScraper:
 
         try:
             # Initialize Gemini browser if not already done
-            if not self.gemini_browser and GEMINI_AVAILABLE and GeminiBrowser:
-                self.gemini_browser = GeminiBrowser(self.page)
+            gemini_browser_cls = None if self.gemini_browser else _load_gemini()
+            if gemini_browser_cls:
+                self.gemini_browser = gemini_browser_cls(self.page)
                 print("[PH]    Initialized Gemini AI browser")
 
             # Step 1: Click row and navigate to details
@@ -807,36 +1177,18 @@ class PlanHubScraper:
                 '.project-details .scope',
                 '.project-details .notes'
             ]
-            for desc_selector in description_selectors:
-                try:
-                    desc_loc = self.page.locator(desc_selector)
-                    if await desc_loc.count() > 0:
-                        desc_text = await desc_loc.first.text_content()
-                        if desc_text and desc_text.strip():
-                            lead['description'] = desc_text.strip()
-                            print(f"[PH]    Description: {desc_text.strip()[:50]}...")
-                            break
-                except:
-                    continue
+            try:
+                desc_text = await self.page.evaluate(_FIRST_TEXT_JS, description_selectors)
+                if desc_text:
+                    lead['description'] = desc_text
+                    print(f"[PH]    Description: {desc_text[:50]}...")
+            except:
+                pass
 
             # Fallback: overview section for description
             if not lead.get('description'):
                 try:
-                    overview_text = await self.page.evaluate('''() => {
-                        const overview = document.querySelector('app-project-details-overview');
-                        if (!overview) return null;
-                        const wrappers = overview.querySelectorAll('.wrapper, .project-details');
-                        let text = '';
-                        for (const wrapper of wrappers) {
-                            const descriptions = wrapper.querySelectorAll('.description');
-                            for (const desc of descriptions) {
-                                if (desc.textContent.length > 50) {
-                                    text += desc.textContent.trim() + ' ';
-                                }
-                            }
-                        }
-                        return text.trim() || null;
-                    }''')
+                    overview_text = await self.page.evaluate(_OVERVIEW_DESCRIPTION_JS)
                     if overview_text:
                         lead['description'] = overview_text
                         print(f"[PH]    Description (from overview): {overview_text[:50]}...")
@@ -868,17 +1220,14 @@ class PlanHubScraper:
                     'mat-button-toggle-group mat-button-toggle:nth-of-type(2) button',
                     '#mat-button-toggle-2-button',
                 ]
-                for css_sel in files_tab_css_fallbacks:
-                    try:
-                        tab_loc = self.page.locator(css_sel)
-                        if await tab_loc.count() > 0:
-                            await tab_loc.first.click()
-                            await asyncio.sleep(2)
-                            files_tab_clicked = True
-                            print(f"[PH]    Files tab clicked via CSS: {css_sel}")
-                            break
-                    except:
-                        continue
+                try:
+                    css_sel = await self.page.evaluate(_CLICK_FIRST_JS, files_tab_css_fallbacks)
+                    if css_sel:
+                        await asyncio.sleep(2)
+                        files_tab_clicked = True
+                        print(f"[PH]    Files tab clicked via CSS: {css_sel}")
+                except:
+                    pass
 
             # Gemini fallback
             if not files_tab_clicked and self.gemini_browser:
@@ -914,17 +1263,13 @@ class PlanHubScraper:
                 'planhub-project-file-table planhub-checkbox mat-checkbox label',
                 'planhub-project-file-table mat-checkbox label',
             ]
-            for css_sel in select_all_css:
-                try:
-                    cb_loc = self.page.locator(css_sel)
-                    if await cb_loc.count() > 0:
-                        await cb_loc.first.click()
-                        await asyncio.sleep(1)
-                        select_all_clicked = True
-                        print(f"[PH]    Select All clicked via CSS")
-                        break
-                except:
-                    continue
+            try:
+                if await self.page.evaluate(_CLICK_FIRST_JS, select_all_css):
+                    await asyncio.sleep(1)
+                    select_all_clicked = True
+                    print(f"[PH]    Select All clicked via CSS")
+            except:
+                pass
 
             if not select_all_clicked and self.gemini_browser:
                 select_all_clicked = await self.gemini_browser.find_and_click(
@@ -934,66 +1279,71 @@ class PlanHubScraper:
                     await asyncio.sleep(1)
                     print("[PH]    Select All clicked via Gemini")
 
-            # Get files before download
-            files_before = set(os.listdir(self.download_dir)) if os.path.exists(self.download_dir) else set()
-
-            # Click Download button
+            # Click Download button. The browser reports the download the
+            # click starts, so there is no fixed wait or download-folder diff
             print("[PH]    Clicking Download button...")
             download_clicked = False
-
-            download_css = [
-                self.config.DOWNLOAD_FILES_BTN,
-                'planhub-project-file-table planhub-button button',
-                'planhub-project-file-table div planhub-button button',
-            ]
-            for css_sel in download_css:
+            new_file = None
+            download_task = asyncio.ensure_future(
+                self.page.wait_for_event('download', timeout=self.config.DOWNLOAD_START_TIMEOUT)
+            )
+            try:
+                download_css = [
+                    self.config.DOWNLOAD_FILES_BTN,
+                    'planhub-project-file-table planhub-button button',
+                    'planhub-project-file-table div planhub-button button',
+                ]
                 try:
-                    dl_loc = self.page.locator(css_sel)
-                    if await dl_loc.count() > 0:
-                        await dl_loc.first.click()
+                    if await self.page.evaluate(_CLICK_FIRST_JS, download_css):
                         print("[PH]    Download clicked via CSS, waiting...")
-                        await asyncio.sleep(10)
                         download_clicked = True
-                        break
-                except:
-                    continue
-
-            if not download_clicked and self.gemini_browser:
-                download_clicked = await self.gemini_browser.find_and_click(
-                    "the 'Download' button (it downloads the selected files)"
-                )
-                if download_clicked:
-                    print("[PH]    Download clicked via Gemini, waiting...")
-                    await asyncio.sleep(10)
-
-            if not download_clicked:
-                print("[PH]    Could not click Download button")
-                try:
-                    debug_path = os.path.join(self.download_dir, 'ph_download_fail.png')
-                    await self.page.screenshot(path=debug_path, full_page=True)
                 except:
                     pass
 
-            # Check for new files
-            files_after = set(os.listdir(self.download_dir)) if os.path.exists(self.download_dir) else set()
-            new_files = files_after - files_before
+                if not download_clicked and self.gemini_browser:
+                    download_clicked = await self.gemini_browser.find_and_click(
+                        "the 'Download' button (it downloads the selected files)"
+                    )
+                    if download_clicked:
+                        print("[PH]    Download clicked via Gemini, waiting...")
 
-            if new_files:
-                new_file = sorted(new_files, key=lambda f: os.path.getmtime(os.path.join(self.download_dir, f)))[-1]
-                local_path = os.path.join(self.download_dir, new_file)
+                if not download_clicked:
+                    print("[PH]    Could not click Download button")
+                    try:
+                        debug_path = os.path.join(self.download_dir, 'ph_download_fail.png')
+                        await self.page.screenshot(path=debug_path, full_page=True)
+                    except:
+                        pass
+                else:
+                    local_path = None
+                    try:
+                        download = await download_task
+                        local_path = self._reserve_download_path(download.suggested_filename)
+                        await download.save_as(local_path)
+                        new_file = os.path.basename(local_path)
+                    except Exception as e:
+                        print(f"[PH]    Download did not complete: {e}")
+                        if local_path and os.path.exists(local_path) and not os.path.getsize(local_path):
+                            os.remove(local_path)
+            finally:
+                if not download_task.done():
+                    download_task.cancel()
+                elif not download_task.cancelled():
+                    download_task.exception()  # retrieved, so asyncio doesn't warn
+
+            if new_file:
                 print(f"[PH]    Downloaded: {new_file}")
 
                 # Try to upload to Google Drive
-                if GDRIVE_AVAILABLE:
-                    gdrive_status = get_status()
+                if gdrive:
+                    gdrive_status = gdrive.get_status()
                     print(f"[PH]    Google Drive status: {gdrive_status}")
 
-                    use_gdrive = should_use_gdrive()
+                    use_gdrive = gdrive.should_use_gdrive()
                     if not use_gdrive and gdrive_status.get('configured') and not gdrive_status.get('authenticated'):
                         print("[PH]    Google Drive configured but not authenticated - attempting auth...")
                         try:
-                            from services.google_drive import authenticate
-                            creds = authenticate()
+                            creds = gdrive.authenticate()
                             if creds:
                                 print("[PH]    Google Drive authentication successful!")
                                 use_gdrive = True
@@ -1011,7 +1361,7 @@ class PlanHubScraper:
                         ext = os.path.splitext(new_file)[1] or '.zip'
                         gdrive_filename = f"{project_name_clean}{ext}"
 
-                        result = upload_and_cleanup(
+                        result = gdrive.upload_and_cleanup(
                             local_path,
                             filename=gdrive_filename,
                             source='PlanHub',
@@ -1033,7 +1383,6 @@ class PlanHubScraper:
                             lead['storage_type'] = 'local'
                     except Exception as e:
                         print(f"[PH]    Google Drive error: {e}, keeping local file")
-                        import traceback
                         traceback.print_exc()
                         web_path = f"/downloads/{new_file}"
                         lead['local_file_path'] = web_path
@@ -1056,10 +1405,28 @@ class PlanHubScraper:
 
         except Exception as e:
             print(f"[PH]    Error in download process: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
+    def _reserve_download_path(self, filename):
+        """Claim a free path for *filename* in the download folder.
+
+        Repeats become "name (1).zip", "name (2).zip", ... as the browser
+        names them, and the empty file is created before returning so
+        another tab can't pick the same name while this one is saving.
+        """
+        base, ext = os.path.splitext(os.path.basename(filename or '') or 'download')
+        os.makedirs(self.download_dir, exist_ok=True)
+        n = 0
+        while True:
+            name = f"{base} ({n}){ext}" if n else f"{base}{ext}"
+            path = os.path.join(self.download_dir, name)
+            try:
+                open(path, 'x').close()
+                return path
+            except FileExistsError:
+                n += 1
+
     async def extract_gc_info(self, lead):
         """Extract General Contractor information from the project details page."""
         print("[PH]    Extracting GC information...")
@@ -1106,118 +1473,35 @@ class PlanHubScraper:
                     print("[PH]      GC tab not found")
                     return
 
-            # Find GC cards
-            gc_card_selector = 'planhub-project-general-contractor-card'
-            gc_cards = self.page.locator(gc_card_selector)
-            card_count = await gc_cards.count()
+            # Preferred GC card (or the first) and its fields, in one round trip
+            gc = await self.page.locator('planhub-project-general-contractor-card').evaluate_all(_GC_CARD_JS)
 
-            if card_count == 0:
+            if not gc:
                 print("[PH]      No GC cards found")
                 return
 
-            # Find preferred GC card (or use first)
-            preferred_index = 0
-            for i in range(card_count):
-                card = gc_cards.nth(i)
-                has_preferred = await card.evaluate('''(card) => {
-                    const badge = card.querySelector('mat-icon');
-                    return badge && (badge.textContent.includes('star') || card.textContent.includes('Preferred'));
-                }''')
-                if has_preferred:
-                    preferred_index = i
-                    break
-
-            preferred_card = gc_cards.nth(preferred_index)
-
-            # Extract company name
-            company_name = await preferred_card.evaluate('''(card) => {
-                const nameEl = card.querySelector('.company-name') ||
-                               card.querySelector('mat-card-title') ||
-                               card.querySelector('.name');
-                if (nameEl && nameEl.textContent.trim()) return nameEl.textContent.trim();
-                const bolds = card.querySelectorAll('strong, b, .bold');
-                for (const b of bolds) {
-                    if (b.textContent.length > 3) return b.textContent.trim();
-                }
-                return null;
-            }''')
-
+            company_name = gc['company']
             if company_name:
                 lead['gc'] = company_name
                 lead['company'] = company_name
                 print(f"[PH]      Company: {company_name}")
 
-            # Extract contact name
-            contact_name = await preferred_card.evaluate('''(card) => {
-                const content = card.querySelector('mat-card-content');
-                if (!content) return null;
-                const divs = content.querySelectorAll('div.content > div');
-                for (const div of divs) {
-                    const icon = div.querySelector('mat-icon');
-                    if (icon && (icon.textContent.includes('person') || icon.textContent.includes('account'))) {
-                        const text = div.textContent.replace(icon.textContent, '').trim();
-                        if (text) return text;
-                    }
-                }
-                if (divs.length >= 2) {
-                    return divs[1].textContent.trim();
-                }
-                return null;
-            }''')
-
-            if contact_name:
-                lead['contact_name'] = contact_name
-                print(f"[PH]      Contact: {contact_name}")
-
-            # Extract phone number
-            phone = await preferred_card.evaluate('''(card) => {
-                const anchors = card.querySelectorAll('planhub-anchor a, a[href^="tel:"]');
-                for (const a of anchors) {
-                    const href = a.getAttribute('href') || '';
-                    if (href.startsWith('tel:')) {
-                        return href.replace('tel:', '').trim();
-                    }
-                    const text = a.textContent.trim();
-                    if (text.match(/[\\d\\-\\(\\)\\s]{10,}/)) {
-                        return text;
-                    }
-                }
-                const text = card.textContent;
-                const phoneMatch = text.match(/\\(?\\d{3}\\)?[\\s\\-]?\\d{3}[\\s\\-]?\\d{4}/);
-                return phoneMatch ? phoneMatch[0] : null;
-            }''')
-
-            if phone:
-                lead['contact_phone'] = phone
-                print(f"[PH]      Phone: {phone}")
-
-            # Extract email
-            email = await preferred_card.evaluate('''(card) => {
-                const anchors = card.querySelectorAll('planhub-anchor a, a[href^="mailto:"]');
-                for (const a of anchors) {
-                    const href = a.getAttribute('href') || '';
-                    if (href.startsWith('mailto:')) {
-                        return href.replace('mailto:', '').trim();
-                    }
-                    const text = a.textContent.trim();
-                    if (text.includes('@')) {
-                        return text;
-                    }
-                }
-                const text = card.textContent;
-                const emailMatch = text.match(/[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}/);
-                return emailMatch ? emailMatch[0] : null;
-            }''')
-
-            if email:
-                lead['contact_email'] = email
-                print(f"[PH]      Email: {email}")
+            if gc['contact']:
+                lead['contact_name'] = gc['contact']
+                print(f"[PH]      Contact: {gc['contact']}")
+
+            if gc['phone']:
+                lead['contact_phone'] = gc['phone']
+                print(f"[PH]      Phone: {gc['phone']}")
+
+            if gc['email']:
+                lead['contact_email'] = gc['email']
+                print(f"[PH]      Email: {gc['email']}")
 
             print("[PH]      GC info extraction complete")
 
         except Exception as e:
             print(f"[PH]    Error in GC extraction: {e}")
-            import traceback
             traceback.print_exc()
 
     async def scrape_all_projects(self, max_projects=None):
@@ -1245,16 +1529,23 @@ class PlanHubScraper:
             log_status("No project rows found")
             return []
 
-        row_count = await rows.count()
+        # Every row's fields come back in a single browser round-trip
+        try:
+            row_fields = await rows.evaluate_all(_ALL_ROWS_FIELDS_JS)
+        except Exception as e:
+            log_status(f"Could not read project rows: {e}")
+            return []
+
+        row_count = len(row_fields)
         projects_to_process = min(row_count, max_projects) if max_projects else row_count
         log_status(f"Processing {projects_to_process} of {row_count} rows...")
 
         valid_leads = []
 
-        for index in range(projects_to_process):
+        for index, fields in enumerate(row_fields[:projects_to_process]):
             try:
-                row_locator = rows.nth(index)
-                details = await self.extract_project_details(row_locator, index)
+                print(f"[PH]    Extracting project {index + 1}...")
+                details = await self._details_from_fields(fields, index)
 
                 if not details:
                     continue
@@ -1280,23 +1571,94 @@ class PlanHubScraper:
         log_status(f"=== PASS 1 Complete: Found {len(valid_leads)} valid leads ===")
 
         # --- PASS 2: Click into each project for details & files ---
-        if valid_leads:
+        # save_results() only adds leads the database doesn't have, so
+        # details and files gathered for a stored lead would be thrown
+        # away; its stored entry already holds them
+        stored_ids = {lead.get('id') for lead in self._load_existing_leads()}
+        new_leads = [lead for lead in valid_leads if lead['id'] not in stored_ids]
+        if len(new_leads) < len(valid_leads):
+            log_status(f"Skipping Pass 2 for {len(valid_leads) - len(new_leads)} leads already in the database")
+        # ...and for leads an interrupted run already finished
+        pending = [lead for lead in new_leads if not self._restore_processed(lead)]
+        if len(pending) < len(new_leads):
+            log_status(f"Resuming: {len(new_leads) - len(pending)} leads already processed")
+        new_leads = pending
+
+        # Drive listing is taken fresh for each scrape
+        self._gdrive_index = None
+        if new_leads:
             log_status("=== PASS 2: Extracting Details & Files ===")
-            for i, lead in enumerate(valid_leads):
-                log_status(f"Processing {i+1}/{len(valid_leads)}: {lead.get('name', '')[:30]}")
+            await self._download_pass(new_leads)
 
-                success = await self.download_files_for_lead(lead)
+        log_status(f"SCRAPING COMPLETE - Total leads: {len(self.leads)}")
+        return self.leads
 
-                if success:
-                    log_status(f"Completed download for project {i+1}")
+    async def _download_pass(self, leads):
+        """Run Pass 2 over *leads* on up to DOM_DOWNLOAD_TABS browser tabs.
 
-                # Return to list for next item
-                log_status("Returning to project list...")
-                await self.navigate_to_projects()
-                await asyncio.sleep(2)
+        Each extra tab gets a shallow copy of the scraper with its own page,
+        so the page-driving methods work unchanged; leads and config stay
+        shared.
+        """
+        queue = asyncio.Queue()
+        for item in enumerate(leads):
+            queue.put_nowait(item)
 
-        log_status(f"SCRAPING COMPLETE - Total leads: {len(self.leads)}")
-        return self.leads
+        # List the Drive folder once up front rather than once per copy
+        gdrive = _load_gdrive()
+        if gdrive and gdrive.should_use_gdrive():
+            self._load_gdrive_index()
+
+        workers = [self]
+        try:
+            for _ in range(min(self.config.DOM_DOWNLOAD_TABS, len(leads)) - 1):
+                try:
+                    page = await self.browser_context.new_page()
+                except Exception as e:
+                    log_status(f"Could not open another download tab: {e}")
+                    break
+                worker = copy.copy(self)
+                worker.page = page
+                worker.gemini_browser = None
+                if await worker.navigate_to_projects():
+                    workers.append(worker)
+                else:
+                    await page.close()
+
+            log_status(f"Downloading on {len(workers)} tab(s)")
+            await asyncio.gather(*(w._download_worker(queue, len(leads)) for w in workers))
+        finally:
+            for worker in workers[1:]:
+                try:
+                    await worker.page.close()
+                except Exception:
+                    pass
+
+    async def _download_worker(self, queue, total):
+        """Take leads off *queue* and run Pass 2 for each on this tab."""
+        while True:
+            try:
+                i, lead = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            log_status(f"Processing {i+1}/{total}: {lead.get('name', '')[:30]}")
+
+            success = await self.download_files_for_lead(lead)
+
+            if success:
+                log_status(f"Completed download for project {i+1}")
+                # Shared by every tab's copy, and written without awaiting,
+                # so tabs can't interleave writes
+                self._processed[lead['id']] = lead
+                self._store_processed()
+
+            # Return to list for next item (navigate_to_projects already waits
+            # for the table); a tab with nothing left to do stays put
+            if queue.empty():
+                return
+            log_status("Returning to project list...")
+            await self.navigate_to_projects()
 
     async def run(self, max_projects=None):
         """Run the full scraping workflow."""
@@ -1307,7 +1669,6 @@ class PlanHubScraper:
             return self.leads
         except Exception as e:
             print(f" Fatal error: {e}")
-            import traceback
             traceback.print_exc()
             if self.page:
                 try:
@@ -1319,6 +1680,7 @@ class PlanHubScraper:
             return []
         finally:
             await self.close_browser()
+            sys.stdout.flush()
 
 
 async def main():
@@ -339,6 +339,64 @@ def check_file_exists(filename, source='BuildingConnected'):
         return None
 
 
+def list_files(source='BuildingConnected'):
+    """
+    List every file in the source folder, for lookups by name.
+
+    One paginated files.list call replaces a check_file_exists() round
+    trip per file when many names are checked in a row.
+
+    Args:
+        source: 'BuildingConnected' or 'PlanHub'
+
+    Returns:
+        dict of filename -> the same dict check_file_exists() returns,
+        or None if the folder could not be listed
+    """
+    if not GOOGLE_DRIVE_AVAILABLE:
+        return None
+
+    service = get_service()
+    if not service:
+        return None
+
+    folder_id = get_source_folder(source)
+    if not folder_id:
+        return None
+
+    try:
+        index = {}
+        page_token = None
+        while True:
+            results = service.files().list(
+                q=f"trashed = false and '{folder_id}' in parents",
+                fields='nextPageToken, files(id, name, webViewLink, webContentLink)',
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+
+            for file in results.get('files', []):
+                name = file.get('name')
+                # Like check_file_exists(), the first match for a name wins
+                if name in index:
+                    continue
+                file_id = file.get('id')
+                index[name] = {
+                    'file_id': file_id,
+                    'web_link': file.get('webViewLink') or f"https://drive.google.com/file/d/{file_id}/view",
+                    'download_link': file.get('webContentLink') or f"https://drive.google.com/uc?id={file_id}&export=download",
+                    'filename': name
+                }
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return index
+
+    except Exception as e:
+        logger.error(f"Error listing files: {e}")
+        return None
+
+
 def upload_file(local_path, filename=None, source='BuildingConnected'):
     """
     Upload a file to Google Drive and return shareable link.
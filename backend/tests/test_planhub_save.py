@@ -0,0 +1,67 @@
+"""Checkpoint saves of the PlanHub API scraper into leads_db.json."""
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Loaded by path: the scrapers package __init__ imports every scraper and
+# their browser dependencies, which these tests don't need
+_spec = importlib.util.spec_from_file_location(
+    "planhub", os.path.join(BACKEND_DIR, "scrapers", "planhub.py")
+)
+planhub = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(planhub)
+
+
+def _fail_replace_once(monkeypatch):
+    """Make the next os.replace() in planhub fail, as a locked file on Windows would."""
+    real = os.replace
+    calls = []
+
+    def replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 1:
+            raise PermissionError("file is locked")
+        return real(src, dst)
+
+    monkeypatch.setattr(planhub.os, "replace", replace)
+
+
+def test_failed_rewrite_is_retried_without_duplicates(tmp_path, monkeypatch):
+    db = str(tmp_path / "leads_db.json")
+    scraper = planhub.PlanHubScraper()
+    leads = [{"id": "old", "download_link": None}]
+    scraper._write_results(db, leads, set())
+
+    # "old" changed since it was saved, so this checkpoint rewrites the file
+    leads[0]["download_link"] = "/downloads/old.zip"
+    leads += [{"id": "a"}, {"id": "b"}]
+    _fail_replace_once(monkeypatch)
+    with pytest.raises(PermissionError):
+        scraper._write_results(db, leads, {"old"})
+    assert not os.path.exists(f"{db}.tmp")
+
+    scraper._write_results(db, leads, {"old"})
+    leads.append({"id": "c"})
+    scraper._write_results(db, leads, set())
+
+    with open(db, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert [lead["id"] for lead in saved] == ["old", "a", "b", "c"]
+    assert saved[0]["download_link"] == "/downloads/old.zip"
+
+
+def test_write_atomic_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "leads_db.json"
+    path.write_bytes(b"[]")
+
+    _fail_replace_once(monkeypatch)
+    with pytest.raises(PermissionError):
+        planhub._write_atomic(str(path), b'[{"id": "a"}]')
+    assert path.read_bytes() == b"[]"
+    assert not os.path.exists(f"{path}.tmp")